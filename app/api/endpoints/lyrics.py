@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException, Depends
 from app.schemas.models import SongMetadata, LyricsData
 from app.services.lyrics_service import LyricsService
@@ -7,6 +8,11 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 # Dependency Injection for Service
+# A single instance is built lazily and deliberately shared by all requests: it holds
+# process-wide state that only works when shared, namely the in-flight fetch registry
+# (LyricsService._inflight) and the search result cache (StorageService._search_cache).
+# Don't treat it as per-request; anything stored on it is visible to concurrent requests.
+@lru_cache(maxsize=1)
 def get_lyrics_service():
     return LyricsService()
 
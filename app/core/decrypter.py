@@ -20,11 +20,21 @@ class QQMusicDecrypt:
         """
         Decrypts a QRC encrypted string using Manual DES implementation to match reference.
         """
+        # 1. Hex Decode
         try:
-            from app.core.manual_des import DESHelper
-            
-            # 1. Hex Decode
             encrypted_bytes = bytes.fromhex(encrypted_text)
+        except ValueError as e:
+            raise DecryptionError(f"QRC Decryption failed: {str(e)}") from e
+
+        return QQMusicDecrypt.decrypt_bytes(encrypted_bytes, key)
+
+    @staticmethod
+    def decrypt_bytes(encrypted_bytes: bytes, key: bytes = DEFAULT_KEY) -> str:
+        """
+        Decrypts raw QRC bytes, skipping the hex round-trip when the payload is already binary.
+        """
+        try:
+            from app.core.manual_des import DESHelper
             
             # Prepare Key Schedules
             # schedule = new byte[3][][]; -> list of 3 lists of 16 lists of 6 bytes (actually handled by KeySchedule)
@@ -91,10 +101,23 @@ class KugouDecrypt:
         Raises:
             DecryptionError: If decryption fails.
         """
+        # 1. Base64 Decode
         try:
-            # 1. Base64 Decode
             file_bytes = base64.b64decode(encrypted_text)
-            
+        except ValueError as e:
+            raise DecryptionError(f"KRC Decryption failed: {str(e)}") from e
+
+        return KugouDecrypt.decrypt_bytes(file_bytes)
+
+    @staticmethod
+    def decrypt_bytes(file_bytes: bytes) -> str:
+        """
+        Decrypts raw KRC file bytes, skipping the Base64 round-trip.
+        
+        Raises:
+            DecryptionError: If decryption fails.
+        """
+        try:
             # 2. Skip Header (4 bytes)
             if len(file_bytes) <= 4:
                 raise DecryptionError("KRC data too short")
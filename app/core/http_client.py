@@ -13,11 +13,12 @@ class HttpClientManager:
     
     Features:
     - HTTP/2 support for multiplexing
-    - Connection pooling (20 keepalive, 40 max)
+    - Connection pooling (20 keepalive, 40 max, idle connections kept for 60s)
     - SSL verification disabled for speed
     - Custom User-Agent
     """
     _client: httpx.AsyncClient | None = None
+    _ai_client: httpx.AsyncClient | None = None
 
     @classmethod
     def get_client(cls) -> httpx.AsyncClient:
@@ -25,7 +26,10 @@ class HttpClientManager:
         if cls._client is None or cls._client.is_closed:
             limits = httpx.Limits(
                 max_keepalive_connections=20,
-                max_connections=40
+                max_connections=40,
+                # Keep idle upstream connections longer than httpx's 5s default so
+                # sporadic requests reuse them instead of paying a new TCP+TLS handshake
+                keepalive_expiry=60.0
             )
             cls._client = httpx.AsyncClient(
                 http2=True,  # HTTP/2 for multiplexing (requires httpx[http2])
@@ -39,9 +43,32 @@ class HttpClientManager:
             )
         return cls._client
 
+    @classmethod
+    def get_ai_client(cls) -> httpx.AsyncClient:
+        """
+        Get or create the shared HTTP client for LLM (OpenAI-compatible) requests.
+        
+        Kept separate from the provider client: LLM calls need a longer timeout,
+        full SSL verification and a larger pool for concurrent enrichments.
+        """
+        if cls._ai_client is None or cls._ai_client.is_closed:
+            limits = httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100
+            )
+            cls._ai_client = httpx.AsyncClient(
+                http2=True,
+                timeout=60.0,
+                limits=limits
+            )
+        return cls._ai_client
+
     @classmethod
     async def close(cls) -> None:
-        """Close the shared client. Call on app shutdown."""
+        """Close the shared clients. Call on app shutdown."""
         if cls._client is not None and not cls._client.is_closed:
             await cls._client.aclose()
             cls._client = None
+        if cls._ai_client is not None and not cls._ai_client.is_closed:
+            await cls._ai_client.aclose()
+            cls._ai_client = None
@@ -1,7 +1,7 @@
 import base64
 import json
 import os
-import random
+import secrets
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad, unpad
 
@@ -50,10 +50,9 @@ def encrypt_weapi(data: dict) -> dict:
     text = json.dumps(data).encode('utf-8')
     
     # 1. Create a 16-char secret key
-    # Simple fixed key for testing or random? 
-    # C# generates random. Let's generate random.
-    chars = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
-    secret = "".join(random.choice(chars) for _ in range(16)).encode('utf-8')
+    # C# generates random. Hex digits are a subset of its alphanumeric charset,
+    # so one C-level call replaces 16 per-character random.choice() calls.
+    secret = secrets.token_hex(8).encode('utf-8')
     
     # 2. First AES: AES(text, NONCE)
     # Note: NONCE is the key here.
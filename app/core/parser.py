@@ -1,11 +1,60 @@
 import xml.etree.ElementTree as ET
 import logging
 import re
-from typing import Optional, Dict
+from typing import Iterator, Optional, Dict, Tuple
 from app.schemas.models import LyricsData, Line, Word
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns (used per line / per segment)
+_META_TAG_RE = re.compile(r'^\[(?:ti|ar|al|au|length|by|offset|re|ve|tool|wrd|#|language|duration|encoding|total|manufacturer|qq|src|app_name|ver|la):', re.IGNORECASE)
+_ENCODED_TAG_RE = re.compile(r'^\[[a-zA-Z_]+:[a-zA-Z0-9+/=_-]{20,}\]?$')
+_LRC_SEGMENT_RE = re.compile(r'^\[(\d+):(\d+(?:\.\d+)?)\](.*)', re.DOTALL)
+_LINE_TIME_RE = re.compile(r'^\[(\d+),(\d+)\](.*)', re.DOTALL)
+_LYRIC_CONTENT_RE = re.compile(r'LyricContent="([^"]+)"')
+_SEGMENT_RE = re.compile(r'(\[[^\]]*\][^\[]*)')
+_KRC_WORD_RE = re.compile(r'<(\d+),(\d+),(\d+)>([^<]*)')
+_QRC_WORD_RE = re.compile(r'([^()]*?)\((\d+),(\d+)\)')
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """
+    Yield the lines of `text` one at a time, without materializing a list like splitlines().
+    Text containing '\r' (CR-only or mixed line endings) falls back to splitlines().
+    """
+    if '\r' in text:
+        yield from text.splitlines()
+        return
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end < 0:
+            if start < len(text):
+                yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+def _parse_lrc_line(line: str) -> Optional[Tuple[float, str]]:
+    """
+    Parse a stripped `[mm:ss.xx]text` line with plain string scans (no regex).
+    
+    Returns:
+        (time in seconds, text) or None if the line has no leading timestamp.
+    """
+    if not line or line[0] != '[':
+        return None
+    rb = line.find(']')
+    if rb < 0:
+        return None
+    colon = line.find(':', 1, rb)
+    if colon < 0:
+        return None
+    minutes = line[1:colon]
+    seconds = line[colon + 1:rb]
+    if not minutes.isdecimal() or not seconds.replace('.', '', 1).isdecimal():
+        return None
+    return int(minutes) * 60 + float(seconds), line[rb + 1:].strip()
+
 class ParsingError(Exception):
     """Base class for parsing errors."""
     pass
@@ -30,24 +79,21 @@ class QrcParser:
         if not trans_content:
             return trans_map
             
-        for line in trans_content.splitlines():
+        for line in _iter_lines(trans_content):
             line = line.strip()
             if not line:
                 continue
             # Skip LRC/QRC metadata tags (including language, duration, encoding, etc.)
-            if re.match(r'^\[(?:ti|ar|al|au|length|by|offset|re|ve|tool|wrd|#|language|duration|encoding|total|manufacturer|qq|src|app_name|ver|la):', line, re.IGNORECASE):
+            if _META_TAG_RE.match(line):
                 continue
             # Also skip bracket tags with long encoded content
-            if re.match(r'^\[[a-zA-Z_]+:[a-zA-Z0-9+/=_-]{20,}\]?$', line):
+            if _ENCODED_TAG_RE.match(line):
                 continue
                 
-            # Parse [mm:ss.xx] format
-            match = re.search(r'\[(\d+):(\d+(?:\.\d+)?)\](.*)', line)
-            if match:
-                minutes = int(match.group(1))
-                seconds = float(match.group(2))
-                text = match.group(3).strip()
-                time_sec = minutes * 60 + seconds
+            # Parse [mm:ss.xx] format (line is stripped, so the tag leads)
+            parsed = _parse_lrc_line(line)
+            if parsed:
+                time_sec, text = parsed
                 
                 # Special handling for // placeholders (interjections/empty lines)
                 if text == '//':
@@ -144,7 +190,7 @@ class QrcParser:
             if not lyric_text:
                 # Try finding text inside <content> if it was wrapped differently?
                 # regex fallback
-                match = re.search(r'LyricContent="([^"]+)"', xml_content)
+                match = _LYRIC_CONTENT_RE.search(xml_content)
                 if match:
                     lyric_text = match.group(1)
                 else:
@@ -166,7 +212,7 @@ class QrcParser:
             # Split by '[' to find segments
             # regex: `\[.*?\][^\[]*`
             # This finds `[tag]content` blocks.
-            segments = re.findall(r'(\[[^\]]*\][^\[]*)', lyric_text)
+            segments = _SEGMENT_RE.findall(lyric_text)
             
             if not segments:
                 # Maybe no brackets found? Fallback to line split?
@@ -178,10 +224,10 @@ class QrcParser:
                     continue
                 
                 # Check headers - skip LRC/QRC metadata tags
-                if re.match(r'^\[(?:ti|ar|al|au|length|by|offset|re|ve|tool|wrd|#|language|duration|encoding|total|manufacturer|qq|src|app_name|ver|la):', segment, re.IGNORECASE):
+                if _META_TAG_RE.match(segment):
                     continue
                 # Also skip bracket tags with long encoded content  
-                if re.match(r'^\[[a-zA-Z_]+:[a-zA-Z0-9+/=_-]{20,}\]?$', segment):
+                if _ENCODED_TAG_RE.match(segment):
                     continue
                 
                 # Extract Line Time
@@ -190,7 +236,7 @@ class QrcParser:
                 content_part = segment
                 
                 # Regex for line time [start,duration]
-                match_line_time = re.match(r'^\[(\d+),(\d+)\](.*)', segment, re.DOTALL)
+                match_line_time = _LINE_TIME_RE.match(segment)
                 if match_line_time:
                     line_start_ms = int(match_line_time.group(1))
                     line_dur_ms = int(match_line_time.group(2))
@@ -199,13 +245,13 @@ class QrcParser:
                     content_part = match_line_time.group(3)
                 else:
                     # Regex for [mm:ss.xx]
-                    match_lrc_time = re.match(r'^\[(\d+):(\d+(\.\d+)?)\](.*)', segment, re.DOTALL)
+                    match_lrc_time = _LRC_SEGMENT_RE.match(segment)
                     if match_lrc_time:
                          m = int(match_lrc_time.group(1))
                          s = float(match_lrc_time.group(2))
                          line_st = m * 60 + s
                          line_et = line_st # No duration known yet
-                         content_part = match_lrc_time.group(4)
+                         content_part = match_lrc_time.group(3)
                     else:
                         # Malformed or text without time? Skip or treat as text line with 0 time?
                         # If strict QRC, we expect time.
@@ -226,7 +272,10 @@ class QrcParser:
                 # Let's check the Log line 7: `[0,740]<0,38,0>Taylor<38,38,0> <76,38,0>Swift...`
                 # It seems to be `<tuple>Text`.
                 
-                krc_matches = re.findall(r'<(\d+),(\d+),(\d+)>([^<]*)', content_part)
+                krc_matches = _KRC_WORD_RE.findall(content_part)
+                
+                # Words and lines are built from already-typed values (floats from int math, str
+                # slices), so model_construct() skips pydantic validation on this per-word hot path.
                 
                 words = []
                 line_txt_parts = []
@@ -240,12 +289,12 @@ class QrcParser:
                          w_st = line_st + (offset_ms / 1000.0)
                          w_et = w_st + (dur_ms / 1000.0)
                          
-                         words.append(Word(txt=text, st=w_st, et=w_et))
+                         words.append(Word.model_construct(txt=text, st=w_st, et=w_et))
                          line_txt_parts.append(text)
                 else:
                     # QRC Logic (Absolute)
                     # Regex: `([^()]*?)\((\d+),(\d+)\)`
-                    qrc_matches = re.findall(r'([^()]*?)\((\d+),(\d+)\)', content_part)
+                    qrc_matches = _QRC_WORD_RE.findall(content_part)
                     
                     for text, offset_str, dur_str in qrc_matches:
                         offset_ms = int(offset_str)
@@ -255,7 +304,7 @@ class QrcParser:
                         w_st = offset_ms / 1000.0
                         w_et = w_st + (dur_ms / 1000.0)
                         
-                        words.append(Word(txt=text, st=w_st, et=w_et))
+                        words.append(Word.model_construct(txt=text, st=w_st, et=w_et))
                         line_txt_parts.append(text)
                 
                 if words:
@@ -263,7 +312,7 @@ class QrcParser:
                     line_txt = "".join(line_txt_parts)
                     # trans_text will be applied later via Reverse Best Match
                     
-                    parsed_lines.append(Line(
+                    parsed_lines.append(Line.model_construct(
                         st=line_st,
                         et=line_et,
                         txt=line_txt,
@@ -275,7 +324,7 @@ class QrcParser:
                     line_txt = content_part.strip()
                     # trans_text will be applied later
                     
-                    parsed_lines.append(Line(
+                    parsed_lines.append(Line.model_construct(
                         st=line_st,
                         et=line_et, # Unknown duration
                         txt=content_part.strip(),
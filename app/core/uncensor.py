@@ -195,7 +195,7 @@ class LyricsUncensor:
             
             if line.txt != original:
                 uncensor_count += 1
-                logger.debug(f"Uncensored: '{original}' -> '{line.txt}'")
+                logger.debug("Uncensored: '%s' -> '%s'", original, line.txt)
             
             # Also uncensor translation if present
             if line.trans:
@@ -32,7 +32,7 @@ class Line(BaseModel):
 class LyricsData(BaseModel):
     type: str = "syllable"
     lines: List[Line]
-    ai_status: str = "success" # success, skipped_length, failed_api
+    ai_status: str = "success" # success, partial, skipped_length, failed_api
     metadata: Optional[SongMetadata] = None
     credits: List[str] = []
 
@@ -1,7 +1,8 @@
 import asyncio
 import logging
 import os
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional
 from app.services.providers.base import BaseProvider, SearchResult
 from app.schemas.models import SongMetadata
 from app.services.providers.qq import QQMusicProvider
@@ -17,74 +18,113 @@ def _is_enabled(env_var: str, default: bool = True) -> bool:
     return value in ("true", "1", "yes", "on")
 
 
+def _env_seconds(env_var: str, default: float) -> float:
+    """Read a non-negative duration in seconds from an environment variable."""
+    try:
+        return max(0.0, float(os.getenv(env_var, default)))
+    except ValueError:
+        logger.warning(f"Invalid {env_var}; using {default}s")
+        return default
+
+
+# Provider registry: (env var, provider class, display name), in registration order
+_PROVIDER_REGISTRY = [
+    ("ENABLE_QQ", QQMusicProvider, "QQ Music"),
+    ("ENABLE_KUGOU", KugouProvider, "Kugou"),
+    ("ENABLE_NETEASE", NeteaseProvider, "Netease"),
+]
+
+# Environment toggles are read once at import time
+_ENABLED_PROVIDERS = {env_var: _is_enabled(env_var) for env_var, _, _ in _PROVIDER_REGISTRY}
+
+
 class Aggregator:
+    # 严谨搜索快速路径：等待时长与所需强匹配数量
+    # 等待期间兜底策略尚未启动，会直接叠加到慢查询的耗时上，因此预算要短；设为 0 则所有策略同时启动
+    FAST_PATH_TIMEOUT = _env_seconds("FAST_PATH_TIMEOUT", 0.3)
+    FAST_PATH_MIN_MATCHES = 5
+
     def __init__(self):
         self.providers: List[BaseProvider] = []
         
         # Conditionally register providers based on environment variables
-        if _is_enabled("ENABLE_QQ"):
-            self.providers.append(QQMusicProvider())
-            logger.info("QQ Music provider enabled")
-        else:
-            logger.info("QQ Music provider disabled")
-            
-        if _is_enabled("ENABLE_KUGOU"):
-            self.providers.append(KugouProvider())
-            logger.info("Kugou provider enabled")
-        else:
-            logger.info("Kugou provider disabled")
-            
-        if _is_enabled("ENABLE_NETEASE"):
-            self.providers.append(NeteaseProvider())
-            logger.info("Netease provider enabled")
-        else:
-            logger.info("Netease provider disabled")
+        for env_var, provider_cls, label in _PROVIDER_REGISTRY:
+            if _ENABLED_PROVIDERS[env_var]:
+                self.providers.append(provider_cls())
+                logger.info(f"{label} provider enabled")
+            else:
+                logger.info(f"{label} provider disabled")
         
         if not self.providers:
             logger.warning("No providers enabled! At least one ENABLE_* env var should be True.")
 
+        # Name -> provider index for O(1) lookup in fetch_lyric
+        self._providers_by_name: Dict[str, BaseProvider] = {p.provider_name: p for p in self.providers}
+
     async def search_all(self, metadata: SongMetadata) -> List[SearchResult]:
         """
         并发执行所有搜索策略（严谨搜索、模糊搜索、兜底搜索）。
         """
-        search_tasks = []
-
         # 策略 1: 原始元数据 (Strict)
-        search_tasks.append(self._execute_search(metadata))
+        strict_task = asyncio.create_task(self._execute_search(metadata))
+        search_tasks = [strict_task]
         
         # 策略 2: 简化艺人名 (Simplified Artist)
         simple_artist = self._simplify_artist(metadata.artist)
         if simple_artist != metadata.artist and simple_artist:
-            new_meta = metadata.model_copy(update={"artist": simple_artist})
-            search_tasks.append(self._execute_search(new_meta))
+            # 快速路径：严谨搜索若在短时间内返回足够多的强匹配，则跳过其余策略，节省上游请求
+            # 超出预算仍未返回时立即启动兜底策略，与严谨搜索并发；之后严谨搜索若返回强匹配，下方循环会取消兜底策略
+            done = set()
+            if self.FAST_PATH_TIMEOUT > 0:
+                done, _ = await asyncio.wait({strict_task}, timeout=self.FAST_PATH_TIMEOUT)
+            if done and self._count_strong_matches(metadata, simple_artist, strict_task.result()) >= self.FAST_PATH_MIN_MATCHES:
+                logger.info("Strict search returned strong matches. Skipping remaining strategies.")
+            else:
+                new_meta = metadata.model_copy(update={"artist": simple_artist})
+                search_tasks.append(asyncio.create_task(self._execute_search(new_meta)))
 
         # 策略 3: 仅歌名 (Title Only)
         # 注意：已注释以减少搜索开销，提升响应速度
         # 如需更宽泛的匹配，可取消注释
         # if metadata.title:
         #     title_meta = metadata.model_copy(update={"artist": ""})
-        #     search_tasks.append(self._execute_search(title_meta))
+        #     search_tasks.append(asyncio.create_task(self._execute_search(title_meta)))
 
-        # 并发执行所有策略
+        # 并发执行所有策略，按完成顺序逐个合并去重
         logger.info(f"Firing {len(search_tasks)} search strategies concurrently...")
-        strategies_results = await asyncio.gather(*search_tasks)
-        
-        # 结果合并与去重
         seen_ids = set()
         final_results = []
         
-        for strategy_res in strategies_results:
-            if not strategy_res: continue
+        for next_done in asyncio.as_completed(search_tasks):
+            strategy_res = await next_done
             for res in strategy_res:
-                # 唯一键：平台_歌曲ID
-                unique_key = f"{res.provider}_{res.id}"
+                # 唯一键：(平台, 歌曲ID)
+                unique_key = (res.provider, res.id)
                 if unique_key not in seen_ids:
                     seen_ids.add(unique_key)
                     final_results.append(res)
+            
+            # 强匹配已足够：提前返回并取消仍在进行的策略
+            # 仅按强匹配判断，结果多但质量差时其余策略（如简化艺人名）仍会继续
+            pending = [task for task in search_tasks if not task.done()]
+            if pending and self._count_strong_matches(metadata, simple_artist, final_results) >= self.FAST_PATH_MIN_MATCHES:
+                for task in pending:
+                    task.cancel()
+                break
         
         logger.info(f"Concurrency search finished. Total unique candidates: {len(final_results)}")
         return final_results
 
+    @staticmethod
+    def _count_strong_matches(metadata: SongMetadata, simple_artist: str, results: List[SearchResult]) -> int:
+        """统计歌名完全一致且包含（简化后）艺人名的结果数量。"""
+        title = metadata.title.strip().lower()
+        artist = simple_artist.lower()
+        return sum(
+            1 for res in results
+            if res.title and res.title.strip().lower() == title and artist in (res.artist or "").lower()
+        )
+
     async def _execute_search(self, metadata: SongMetadata) -> List[SearchResult]:
         """
         内部函数：并发调用所有 Enabled 的 Provider 进行搜索，并应用差异化超时。
@@ -94,10 +134,14 @@ class Aggregator:
             # --- 关键优化：差异化超时 ---
             # 国内源（QQ/网易）通常很快，给 15s 作为兜底
             timeout = 15.0
+            started = time.perf_counter()
             
             try:
                 # 使用 asyncio.wait_for 强制超时
-                return await asyncio.wait_for(provider.search(metadata), timeout=timeout)
+                results = await asyncio.wait_for(provider.search(metadata), timeout=timeout)
+                # 记录各平台耗时，便于定位慢源（debug 级别通常关闭，使用惰性格式化）
+                logger.debug("Provider %s returned %d results in %.3fs", provider.provider_name, len(results), time.perf_counter() - started)
+                return results
             except asyncio.TimeoutError:
                 logger.warning(f"Provider {provider.provider_name} timed out after {timeout}s")
                 return []
@@ -107,14 +151,12 @@ class Aggregator:
 
         # 创建并发任务
         tasks = [search_with_timeout(provider) for provider in self.providers]
-        results_list = await asyncio.gather(*tasks, return_exceptions=True)
+        # search_with_timeout 已捕获所有异常并返回 []，无需 return_exceptions
+        results_list = await asyncio.gather(*tasks)
         
         all_results = []
         for result in results_list:
-            if isinstance(result, list):
-                all_results.extend(result)
-            # 注意：由于我们在 search_with_timeout 里捕获了 Exception，
-            # 这里的 result 理论上只会是 list。但在极个别情况下做个类型检查更安全。
+            all_results.extend(result)
             
         return all_results
 
@@ -132,7 +174,7 @@ class Aggregator:
         """
         Fetch lyric content from a specific provider.
         """
-        provider = next((p for p in self.providers if p.provider_name == provider_name), None)
+        provider = self._providers_by_name.get(provider_name)
         if not provider:
             logger.error(f"Provider not found: {provider_name}")
             return None
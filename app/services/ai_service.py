@@ -2,8 +2,9 @@ import os
 import logging
 import json
 import asyncio
-from typing import List, Optional, Dict
+from typing import Any, AsyncIterator, List, Optional, Dict, Tuple
 from app.schemas.models import LyricsData, Line
+from app.core.http_client import HttpClientManager
 
 # Try importing openai, handle if missing (though should be added to requirements)
 try:
@@ -14,18 +15,32 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\r\n"
+_JSON_SKIP_CHARS = _JSON_WHITESPACE + "{,"
+
 class AIService:
     """
     Service to enrich lyrics using OpenAI LLM.
     Features: Translation, Romaji generation, Explicit content tagging.
     """
+    # Lines per LLM request; long lyrics are split into concurrent sub-batches
+    BATCH_SIZE = 40
+    MAX_CONCURRENT_BATCHES = 4
+    # Output token budget per request (JSON entry with trans + romaji per line)
+    MAX_TOKENS_PER_LINE = 80
+    MAX_TOKENS = 4096
     
     def __init__(self):
         self.api_key = os.getenv("ENRICH_KEY")
         self.base_url = os.getenv("ENRICH_URL")
         self.client = None
         if has_openai and self.api_key:
-            self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url if self.base_url else None)
+            self.client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url if self.base_url else None,
+                http_client=HttpClientManager.get_ai_client()
+            )
         else:
             if not has_openai:
                 logger.warning("openai package not installed. AI Enrichment disabled.")
@@ -46,7 +61,7 @@ class AIService:
                 try:
                     # Support Base URL if provided
                     base_url = ai_config.base_url if ai_config.base_url else None
-                    client = AsyncOpenAI(api_key=ai_config.api_key, base_url=base_url)
+                    client = AsyncOpenAI(api_key=ai_config.api_key, base_url=base_url, http_client=HttpClientManager.get_ai_client())
                     if ai_config.model:
                         current_model = ai_config.model
                     logger.info("Using Client-provided AI Config.")
@@ -65,18 +80,18 @@ class AIService:
             return lyrics
 
         # 1. Detect Language and Needs
-        all_text = "".join([l.txt for l in lyrics.lines])
-        sample_text = all_text[:200]
+        # Only the first 200 chars are sampled; stop collecting once reached
+        sample_parts = []
+        sample_len = 0
+        for l in lyrics.lines:
+            sample_parts.append(l.txt)
+            sample_len += len(l.txt)
+            if sample_len >= 200:
+                break
+        sample_text = "".join(sample_parts)[:200]
         lang = self._detect_language(sample_text)
         logger.info(f"Detected language: {lang}")
         
-        # Pre-flight Length Check
-        total_chars = len(all_text)
-        if total_chars > 2000:
-            logger.warning(f"Lyrics too long for AI ({total_chars} chars). Skipping.")
-            lyrics.ai_status = "skipped_length"
-            return lyrics
-
         needs_romaji = lang in ['ja', 'ko']
         
         # 2. Batch Process
@@ -90,38 +105,75 @@ class AIService:
         if unused := len(lines_to_process) == 0:
             return lyrics
 
-        logger.info(f"Enriching {len(lines_to_process)} lines via AI...")
+        # Long lyrics are split into sub-batches sent to the LLM concurrently
+        batches = [
+            lines_to_process[i:i + self.BATCH_SIZE]
+            for i in range(0, len(lines_to_process), self.BATCH_SIZE)
+        ]
+        logger.info(f"Enriching {len(lines_to_process)} lines via AI in {len(batches)} batch(es)...")
         
-        # 3. Call LLM
-        # Pass the specific client we decided to use
-        enriched_map = await self._call_llm(client, current_model, lines_to_process, target_lang, needs_romaji, style_instruction)
-        
-        if not enriched_map:
-             lyrics.ai_status = "failed_api"
-             return lyrics
+        # 3. Call LLM & 4. Merge Results
+        # Results are streamed back; each line is merged as soon as its entry is complete.
+        lines_by_st: Dict[str, List[Line]] = {}
+        for line in lyrics.lines:
+            lines_by_st.setdefault(str(line.st), []).append(line)
 
-        # 4. Merge Results
+        failed_batches = 0
         updated_count = 0
-        for line in lyrics.lines:
-            enrich_info = enriched_map.get(str(line.st)) # Try string key
-            if not enrich_info:
-                enrich_info = enriched_map.get(line.st) # Try float key
-                
-            if enrich_info:
-                if not line.trans and enrich_info.get("trans"):
-                     line.trans = enrich_info.get("trans")
-                elif style_instruction and enrich_info.get("trans"):
-                     line.trans = enrich_info.get("trans")
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+
+        def merge_entry(st_key: str, enrich_info: Dict):
+            nonlocal updated_count
+            if not isinstance(enrich_info, dict):
+                return
+
+            trans = enrich_info.get("trans")
+            romaji = enrich_info.get("romaji")
+            explicit = bool(enrich_info.get("explicit"))
+
+            for line in lines_by_st.get(st_key, ()):
+                # Only assign fields that actually change
+                updates = {}
+                if trans and (not line.trans or style_instruction) and line.trans != trans:
+                    updates["trans"] = trans
+                if romaji and not line.romaji:
+                    updates["romaji"] = romaji
+                if explicit and not line.explicit:
+                    updates["explicit"] = True
                 
-                if not line.romaji and enrich_info.get("romaji"):
-                     line.romaji = enrich_info.get("romaji")
-                     
-                if enrich_info.get("explicit"):
-                    line.explicit = True
-                    
+                if not updates:
+                    continue
+                for field, value in updates.items():
+                    setattr(line, field, value)
                 updated_count += 1
+
+        async def process_batch(batch: List[Dict]):
+            nonlocal failed_batches
+            received = 0
+            try:
+                async with semaphore:
+                    async for st_key, enrich_info in self._call_llm(client, current_model, batch, target_lang, needs_romaji, style_instruction):
+                        received += 1
+                        merge_entry(st_key, enrich_info)
+            except Exception:
+                # Already logged by _call_llm; entries merged before the error are kept
+                failed_batches += 1
+                return
+            if not received:
+                failed_batches += 1
+
+        await asyncio.gather(*(process_batch(batch) for batch in batches))
+
+        # A batch fails if its call errored or returned no entries
+        if failed_batches == len(batches):
+             lyrics.ai_status = "failed_api"
+             return lyrics
         
-        lyrics.ai_status = "success"
+        if failed_batches:
+            lyrics.ai_status = "partial"
+            logger.warning(f"{failed_batches}/{len(batches)} AI batch(es) failed; lyrics are partially enriched.")
+        else:
+            lyrics.ai_status = "success"
         logger.info(f"Enriched {updated_count} lines.")
         return lyrics
 
@@ -142,9 +194,10 @@ class AIService:
             return 'zh'
         return 'en' # Default/Other
 
-    async def _call_llm(self, client, model: str, lines: List[Dict], target_lang: str, include_romaji: bool, style_instruction: Optional[str] = None) -> Dict:
+    async def _call_llm(self, client, model: str, lines: List[Dict], target_lang: str, include_romaji: bool, style_instruction: Optional[str] = None) -> AsyncIterator[Tuple[str, Dict]]:
         """
         Calls OpenAI to process lines using provided client.
+        Streams the completion and yields (st, info) pairs as each top-level entry completes.
         """
         # Prepare Prompt
         style_prompt = f" User Style Requirement: {style_instruction}" if style_instruction else " Keep the translation neutral, accurate, and concise."
@@ -160,26 +213,77 @@ class AIService:
             f"{style_prompt}"
         )
         
-        # Batching: Simple implementation sends all.
         # Construct simplified input to save tokens
         user_content = json.dumps(lines, ensure_ascii=False)
         
         try:
-            response = await client.chat.completions.create(
+            stream = await client.chat.completions.create(
                 model=model, 
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_content}
                 ],
-                response_format={ "type": "json_object" }
+                response_format={ "type": "json_object" },
+                # Bound generation length and keep output deterministic
+                max_tokens=min(self.MAX_TOKENS, self.MAX_TOKENS_PER_LINE * len(lines)),
+                temperature=0,
+                seed=42,
+                stream=True
             )
             
-            content = response.choices[0].message.content
-            if not content:
-                return {}
+            buffer = ""
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
                 
-            return json.loads(content)
+                buffer += delta
+                items, consumed = _parse_json_items(buffer)
+                # Drop consumed text so the buffer only holds the entry being generated
+                buffer = buffer[consumed:]
+                for item in items:
+                    yield item
             
         except Exception as e:
             logger.error(f"LLM Call failed: {e}")
-            return {}
+            raise
+
+
+def _parse_json_items(buffer: str) -> Tuple[List[Tuple[str, Any]], int]:
+    """
+    Incrementally parse the top-level entries of a streamed JSON object.
+    
+    Returns:
+        The completed (key, value) pairs and the number of characters consumed.
+        Incomplete trailing entries are left in place for the next call.
+    """
+    items = []
+    pos = 0
+    size = len(buffer)
+    
+    while True:
+        # Skip the opening brace, separators and whitespace between entries
+        while pos < size and buffer[pos] in _JSON_SKIP_CHARS:
+            pos += 1
+        if pos >= size or buffer[pos] == "}":
+            return items, pos
+        
+        try:
+            key, key_end = _JSON_DECODER.raw_decode(buffer, pos)
+            colon = buffer.index(":", key_end)
+            value_start = colon + 1
+            while value_start < size and buffer[value_start] in _JSON_WHITESPACE:
+                value_start += 1
+            value, value_end = _JSON_DECODER.raw_decode(buffer, value_start)
+        except ValueError:
+            # Entry is still being generated
+            return items, pos
+        
+        # Scalars may be cut mid-token; only accept them once a delimiter follows
+        if not isinstance(value, (dict, list, str)) and value_end >= size:
+            return items, pos
+        
+        items.append((str(key), value))
+        pos = value_end
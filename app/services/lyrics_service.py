@@ -1,11 +1,14 @@
 import asyncio
+import functools
+import heapq
 import logging
-import base64
 import json
 import re
-from typing import Optional, Dict, List
+import threading
+from typing import Optional, Dict, List, Tuple, Union
 
 from app.services.aggregator import Aggregator
+from app.services.providers.base import SearchResult
 from app.services.storage_service import StorageService
 from app.services.ai_service import AIService
 from app.core.decrypter import QQMusicDecrypt, KugouDecrypt, DecryptionError
@@ -16,6 +19,61 @@ from app.schemas.models import LyricsData, SongMetadata, Line
 
 logger = logging.getLogger(__name__)
 
+# Separators splitting multi-artist credits; the first artist is kept
+_ARTIST_SEPARATORS = ("&", ",", ";", " feat.", " ft.", " vs.", " x ")
+
+# Markers of instrumental/empty lyrics ("纯音乐" also covers "纯音乐请欣赏"), matched in one pass
+_INSTRUMENTAL_RE = re.compile(r'纯音乐|instrumental|no lyrics|没有歌词', re.IGNORECASE)
+
+# Providers serving syllable-synced lyrics (QRC/KRC)
+_SYLLABLE_PROVIDERS = frozenset(('qq music', 'kugou', 'qq', 'kugou music'))
+
+# LRC line: [mm:ss.xx]Text, anchored at line start so a whole blob can be scanned with finditer.
+# A line starts after \n or a lone \r (CR-only files); the first line may carry a UTF-8 BOM.
+# Compressed LRC repeats the stamp run ([00:21.10][00:45.10]Chorus); group 1 holds all leading stamps.
+_LRC_LINE_RE = re.compile(r'(?:^|(?<=\r))\ufeff?[ \t]*((?:\[\d+:\d+(?:\.\d+)?\])+)([^\r\n]*)', re.MULTILINE)
+_LRC_STAMP_RE = re.compile(r'\[(\d+):(\d+(?:\.\d+)?)\]')
+# Bytes variants for plain-LRC payloads, so only each line's text needs decoding
+_LRC_LINE_RE_B = re.compile(rb'(?:^|(?<=\r))(?:\xef\xbb\xbf)?[ \t]*((?:\[\d+:\d+(?:\.\d+)?\])+)([^\r\n]*)', re.MULTILINE)
+_LRC_STAMP_RE_B = re.compile(rb'\[(\d+):(\d+(?:\.\d+)?)\]')
+
+
+def _parse_lrc(content: Union[str, bytes]) -> List[Tuple[float, str]]:
+    """
+    Parse LRC content into (time in seconds, text) pairs in a single pass.
+    Values are already float/str, so callers may build Lines with model_construct() (no validation).
+    Bytes content is scanned as-is and only each line's text is decoded.
+    A line with several leading stamps yields one pair per stamp; the result is then sorted by time.
+    """
+    is_bytes = isinstance(content, bytes)
+    line_re, stamp_re = (_LRC_LINE_RE_B, _LRC_STAMP_RE_B) if is_bytes else (_LRC_LINE_RE, _LRC_STAMP_RE)
+    
+    pairs = []
+    compressed = False
+    for m in line_re.finditer(content):
+        text = m.group(2)
+        if is_bytes:
+            text = text.decode('utf-8', errors='ignore')
+        text = text.strip()
+        
+        stamps = stamp_re.findall(m.group(1))
+        if len(stamps) > 1:
+            compressed = True
+        for minutes, seconds in stamps:
+            pairs.append((int(minutes) * 60 + float(seconds), text))
+    
+    if compressed:
+        pairs.sort(key=lambda pair: pair[0])
+    return pairs
+
+
+def _build_trans_map(content: Optional[str]) -> Dict[int, str]:
+    """Map translation LRC lines by integer milliseconds (exact matches, unlike float seconds)."""
+    if not content:
+        return {}
+    return {round(time_sec * 1000): text for time_sec, text in _parse_lrc(content)}
+
+
 try:
     from deep_translator import GoogleTranslator
     has_translator = True
@@ -23,10 +81,68 @@ except ImportError:
     has_translator = False
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
 except ImportError:
-    # Fallback
+    # Fallback: token-overlap scoring, much less precise than rapidfuzz
     fuzz = None
+    logger.warning("rapidfuzz not installed. Falling back to token-overlap scoring for candidate matching.")
+
+
+class _Candidate:
+    """A scored search result; slotted to keep per-candidate records small."""
+    __slots__ = ("is_syllable", "score", "result")
+
+    def __init__(self, is_syllable: bool, score: float, result: SearchResult):
+        self.is_syllable = is_syllable
+        self.score = score
+        self.result = result
+
+
+class _InflightFetch:
+    """A shared in-flight get_standardized_lyrics call and the number of callers awaiting it."""
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+def _is_syllable_provider(res: SearchResult) -> bool:
+    """Whether the result comes from a provider with syllable-synced lyrics (QRC/KRC)."""
+    return res.provider.lower() in _SYLLABLE_PROVIDERS
+
+
+def _batch_scores(query: str, choices: List[str], scorer, score_cutoff: float = 0) -> List[float]:
+    """
+    Score query against every choice in a single rapidfuzz call, returned in choice order.
+    Choices scoring below `score_cutoff` are pruned early by rapidfuzz and reported as 0.
+    """
+    scores = [0.0] * len(choices)
+    for _, score, index in process.extract(query, choices, scorer=scorer, processor=None, limit=None, score_cutoff=score_cutoff):
+        scores[index] = score
+    return scores
+
+
+# Translators are reused per (source, target) within each worker thread: instances
+# mutate their request params on translate() and cannot be shared across threads.
+_thread_translators = threading.local()
+
+
+def _get_translator(source: str, target: str) -> "GoogleTranslator":
+    """Return this thread's translator for (source, target), creating it on first use."""
+    translators = getattr(_thread_translators, "by_pair", None)
+    if translators is None:
+        translators = _thread_translators.by_pair = {}
+    translator = translators.get((source, target))
+    if translator is None:
+        translator = translators[(source, target)] = GoogleTranslator(source=source, target=target)
+    return translator
+
+
+@functools.lru_cache(maxsize=4096)
+def _translate_cached(text: str, source: str, target: str) -> str:
+    """Translate text via Google Translator, memoized per (text, source, target)."""
+    return _get_translator(source, target).translate(text) or text
 
 class LyricsService:
     """
@@ -44,27 +160,51 @@ class LyricsService:
         self.aggregator = Aggregator()
         self.storage = StorageService()
         self.ai_service = AIService()
+        # (song_id, provider) -> shared fetch for concurrent identical requests
+        self._inflight: Dict[Tuple[str, str], _InflightFetch] = {}
 
-    def _simplify_artist(self, artist: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _simplify_artist(artist: str) -> str:
         if not artist: return ""
-        separators = ["&", ",", ";", " feat.", " ft.", " vs.", " x "]
         cleaned = artist
-        for sep in separators:
+        for sep in _ARTIST_SEPARATORS:
             if sep in cleaned:
                 cleaned = cleaned.split(sep)[0]
         return cleaned.strip()
 
-    def _translate_text(self, text: str, target: str) -> str:
+    def _translate_text(self, text: str, target: str, source: str = 'auto') -> str:
         """Translate text using Google Translator (deep-translator)."""
         if not has_translator or not text:
             return text
         try:
-            return GoogleTranslator(source='auto', target=target).translate(text)
+            return _translate_cached(text, source, target)
         except Exception as e:
             logger.warning(f"Translation failed: {e}")
             return text
 
-    def _detect_and_translate_romaji(self, artist: str, title: str) -> Optional[SongMetadata]:
+    async def _translate_pair(self, first: str, second: str, target: str, source: str = 'auto') -> Tuple[str, str]:
+        """
+        Translate two short strings (e.g. artist and title) with a single request.
+        The strings are sent newline-joined; if the line structure is not preserved,
+        falls back to translating both separately and concurrently.
+        Blocking HTTP calls run in worker threads to keep the event loop free.
+        """
+        if has_translator and first and second:
+            try:
+                joined = await asyncio.to_thread(_translate_cached, f"{first}\n{second}", source, target)
+                parts = joined.split("\n")
+                if len(parts) == 2:
+                    return parts[0].strip(), parts[1].strip()
+            except Exception as e:
+                logger.warning(f"Batched translation failed: {e}")
+        first_trans, second_trans = await asyncio.gather(
+            asyncio.to_thread(self._translate_text, first, target, source),
+            asyncio.to_thread(self._translate_text, second, target, source)
+        )
+        return first_trans, second_trans
+
+    async def _detect_and_translate_romaji(self, artist: str, title: str) -> Optional[SongMetadata]:
         """
         Detect if artist/title is likely Romaji and translate to Japanese.
         Criterion: Mostly Latin characters but not common English words (heuristic fallback).
@@ -80,12 +220,11 @@ class LyricsService:
         
         try:
             # We only translate if input is ASCII/Latin.
-            if not all(ord(c) < 128 for c in artist.replace(" ", "") + title.replace(" ", "")):
+            if not (artist.isascii() and title.isascii()):
                 return None
 
             # Force source='en' to encourage transliteration to Japanese
-            ja_artist = GoogleTranslator(source='en', target='ja').translate(artist)
-            ja_title = GoogleTranslator(source='en', target='ja').translate(title)
+            ja_artist, ja_title = await self._translate_pair(artist, title, 'ja', 'en')
             
             # If translation is same as input (failed or same), skip
             if ja_artist == artist and ja_title == title:
@@ -106,17 +245,40 @@ class LyricsService:
         # Heuristic: Single line with specific keywords
         if len(lyrics.lines) <= 2:
             # Check combined text of few lines
-            full_text = " ".join([l.txt.lower() for l in lyrics.lines])
-            keywords = ["纯音乐", "instrumental", "no lyrics", "没有歌词", "纯音乐请欣赏"]
-            if any(k in full_text for k in keywords):
+            full_text = " ".join(l.txt for l in lyrics.lines)
+            if _INSTRUMENTAL_RE.search(full_text):
                 return True
                 
         return False
 
 
+    async def _finalize_lyrics(self, result: LyricsData, song_id: str, provider: str, metadata: Optional[SongMetadata], style_instruction: Optional[str]) -> LyricsData:
+        """
+        Post-process freshly parsed lyrics: metadata, cleaning, uncensoring and caching.
+        Instrumental results take the same path, so they are cached like any other song;
+        match_best_lyrics tells them apart with _is_instrumental.
+        """
+        # Phase 4.5: Metadata & Cleaning
+        if metadata:
+            result.metadata = metadata
+        
+        result = LyricsCleaner.clean(result)
+        result = LyricsUncensor.uncensor_lyrics(result)
+        
+        # Phase 3: AI Enrichment (Decoupled)
+        if not result.ai_status:
+            result.ai_status = "can_enrich"
+        
+        # Cache Policy: Save unless Custom Style (file write runs off the event loop, like load)
+        if not style_instruction:
+            await asyncio.to_thread(self.storage.save, song_id, provider, result)
+        return result
+
     async def get_standardized_lyrics(self, song_id: str, provider: str, style_instruction: Optional[str] = None, ai_config: Optional['AIConfig'] = None, metadata: Optional[SongMetadata] = None) -> Optional[LyricsData]:
         """
         Orchestrates the process of getting standardized lyrics.
+        Concurrent requests for the same song share one download/decrypt/parse
+        (custom-styled requests are always processed on their own).
         
         Args:
             song_id: The provider-specific song ID.
@@ -128,10 +290,52 @@ class LyricsService:
         Returns:
             LyricsData object or None if failed.
         """
+        if style_instruction:
+            return await self._fetch_standardized_lyrics(song_id, provider, style_instruction, ai_config, metadata)
+        
+        key = (song_id, provider)
+        inflight = self._inflight.get(key)
+        # A cancelled fetch is a miss: joining it would raise CancelledError in a caller that wasn't cancelled
+        joined = inflight is not None and not inflight.task.cancelled()
+        if not joined:
+            task = asyncio.create_task(self._fetch_standardized_lyrics(song_id, provider, None, ai_config, metadata))
+            inflight = self._inflight[key] = _InflightFetch(task)
+            task.add_done_callback(functools.partial(self._forget_inflight, key, inflight))
+        else:
+            logger.info(f"Joining in-flight request for {song_id} ({provider})")
+        
+        inflight.waiters += 1
+        try:
+            result = await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            # Only abandon the shared work once nobody is waiting for it
+            if not inflight.waiters and not inflight.task.done():
+                inflight.task.cancel()
+                # Unregister now rather than in the done-callback, so callers arriving
+                # before the cancellation completes start a fresh fetch
+                self._forget_inflight(key, inflight)
+        
+        if joined and result is not None:
+            # Joiners get their own copy; callers may mutate lines (e.g. AI enrichment)
+            result = result.model_copy(deep=True)
+            if metadata:
+                result.metadata = metadata
+        return result
+
+    def _forget_inflight(self, key: Tuple[str, str], inflight: _InflightFetch, _task: Optional[asyncio.Task] = None) -> None:
+        """Remove `inflight` from the registry, unless a newer fetch has already replaced it."""
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+
+    async def _fetch_standardized_lyrics(self, song_id: str, provider: str, style_instruction: Optional[str], ai_config: Optional['AIConfig'], metadata: Optional[SongMetadata]) -> Optional[LyricsData]:
+        """Cache lookup, download, decrypt, parse and post-process for get_standardized_lyrics."""
         logger.info(f"Requests standardized lyrics for {song_id} from {provider}")
 
-        # Step 0: Check Cache
-        cached_data = self.storage.load(song_id, provider)
+        # Step 0: Check Cache (file read off the event loop)
+        # The cache is checked before any download starts: hits must not spend upstream rate limits.
+        cached_data = await asyncio.to_thread(self.storage.load, song_id, provider)
+        
         if cached_data:
             logger.info(f"Cache Hit for {song_id} ({provider})")
             if style_instruction:
@@ -174,6 +378,7 @@ class LyricsService:
 
         # Step 2: Decrypt
         decrypted_xml = ""
+        lrc_bytes = None  # Undecoded plain-LRC payload
         trans_lrc = None  # Decrypted translation LRC
         is_lrc = False
         try:
@@ -183,29 +388,34 @@ class LyricsService:
             # Heuristic: Check if data looks like plain text LRC already
             # LRC usually starts with [ or contains [00:
             # QRC encrypted is binary.
-            if raw_data.strip().startswith(b"[") or b"[00:" in raw_data[:50]:
+            # Only a short head is inspected; stripping the whole payload would copy it.
+            head = raw_data[:64]
+            if head.lstrip().startswith(b"[") or b"[00:" in head[:50]:
                 logger.info("Raw data appears to be plain text LRC. Skipping decryption.")
-                decrypted_xml = raw_data.decode('utf-8', errors='ignore')
+                if head.lstrip().startswith(b"{"):
+                    # Netease JSON with an embedded LRC; needs the JSON parse below
+                    decrypted_xml = raw_data.decode('utf-8', errors='ignore')
+                else:
+                    # Parsed as bytes in the LRC fallback; skip decoding the whole payload
+                    lrc_bytes = raw_data
                 is_lrc = True
             elif "qq" in provider_key:
                 # QQ Music: Decrypt main lyrics
-                encrypted_hex = raw_data.hex().upper()
-                decrypted_xml = QQMusicDecrypt.decrypt(encrypted_hex)
+                # Decryption is CPU-bound; run it in a worker thread so other candidates keep progressing
+                decrypted_xml = await asyncio.to_thread(QQMusicDecrypt.decrypt_bytes, raw_data)
                 
                 # Also decrypt translation if present
                 if trans_bytes and len(trans_bytes) > 0:
                     try:
-                        trans_hex = trans_bytes.hex().upper()
-                        trans_lrc = QQMusicDecrypt.decrypt(trans_hex)
+                        trans_lrc = await asyncio.to_thread(QQMusicDecrypt.decrypt_bytes, trans_bytes)
                         logger.info(f"Decrypted translation LRC ({len(trans_lrc)} chars)")
                     except Exception as te:
                         logger.warning(f"Failed to decrypt translation: {te}")
                         trans_lrc = None
                 
             elif "kugou" in provider_key:
-                # Kugou expects Base64 string?
-                encrypted_b64 = base64.b64encode(raw_data).decode('utf-8')
-                decrypted_xml = KugouDecrypt.decrypt(encrypted_b64)
+                # Provider already Base64-decoded the KRC file; decrypt the raw bytes directly
+                decrypted_xml = await asyncio.to_thread(KugouDecrypt.decrypt_bytes, raw_data)
                 
             else:
                 # Assume plaintext or handle other providers?
@@ -227,13 +437,16 @@ class LyricsService:
         # Step 3: Parse
         try:
             # 1. Try Netease/JSON first (since QrcParser is permissive and might misinterpret JSON)
-            import json
-            try:
-                # Try parsing as JSON first (Netease)
-                json_data = json.loads(decrypted_xml)
-                is_json = True 
-            except json.JSONDecodeError:
-                is_json = False
+            # Only a payload starting with '{' can be the Netease object; skip the full parse otherwise
+            is_json = False
+            stripped = decrypted_xml.lstrip()
+            if stripped.startswith("{"):
+                try:
+                    # Try parsing as JSON first (Netease)
+                    json_data = json.loads(stripped)
+                    is_json = True 
+                except json.JSONDecodeError:
+                    pass
 
             if is_json and isinstance(json_data, dict):
                  # Check if this is an "uncollected" or empty response
@@ -258,113 +471,35 @@ class LyricsService:
                     # We can use QrcParser on the content if it's QRC (rare for Netease) or manual LRC parse.
                     # Netease is usually standard LRC.
                     
-                    trans_map = {} # {time_sec: trans_text}
-                    if trans_content:
-                        import re
-                        for line in trans_content.splitlines():
-                            line = line.strip()
-                            if not line: continue
-                            match = re.search(r'\[(\d+):(\d+(\.\d+)?)\](.*)', line)
-                            if match:
-                                minutes = int(match.group(1))
-                                seconds = float(match.group(2))
-                                text = match.group(4).strip()
-                                time_sec = minutes * 60 + seconds
-                                trans_map[time_sec] = text
+                    trans_map = _build_trans_map(trans_content) # {time_ms: trans_text}
+                    if trans_map:
                         logger.info(f"Built Trans Map with {len(trans_map)} entries.")
                     
-                    lines = []
-                    import re
-                    for line_str in lrc_content.splitlines():
-                        line_str = line_str.strip()
-                        if not line_str: continue
-                        match = re.search(r'\[(\d+):(\d+(\.\d+)?)\](.*)', line_str)
-                        if match:
-                            minutes = int(match.group(1))
-                            seconds = float(match.group(2))
-                            text = match.group(4).strip()
-                            time_sec = minutes * 60 + seconds
-                            
-                            trans_text = trans_map.get(time_sec)
-                            
-                            from app.schemas.models import Line
-                            lines.append(Line(st=time_sec, et=time_sec, txt=text, trans=trans_text, words=[]))
+                    lines = [
+                        Line.model_construct(st=time_sec, et=time_sec, txt=txt, trans=trans_map.get(round(time_sec * 1000)), words=[])
+                        for time_sec, txt in _parse_lrc(lrc_content)
+                    ]
                     
                     if lines:
-                        result = LyricsData(lines=lines)
-                        
-                        # Phase 4.5: Metadata & Cleaning
-                        if metadata:
-                            result.metadata = metadata
-                        
-                        result = LyricsCleaner.clean(result)
-                        result = LyricsUncensor.uncensor_lyrics(result)
-                        
-                        # Phase 3: AI Enrichment (Decoupled)
-                        if not result.ai_status:
-                             result.ai_status = "can_enrich"
-                             
-                        # Cache Policy: Save unless Custom Style
-                        if not style_instruction:
-                            self.storage.save(song_id, provider, result)
-                        return result
+                        return await self._finalize_lyrics(LyricsData(lines=lines), song_id, provider, metadata, style_instruction)
             
             # 2. QRC Parser (if not JSON or JSON parsing didn't return)
             if not is_lrc:
                 try:
                     result = QrcParser.parse(decrypted_xml, trans_content=trans_lrc)
-                    
-                    # Phase 4.5: Metadata & Cleaning
-                    if metadata:
-                        result.metadata = metadata
-                    
-                    result = LyricsCleaner.clean(result)
-                    result = LyricsUncensor.uncensor_lyrics(result)
-
-                    # Phase 3: AI Enrichment (Decoupled)
-                    if not result.ai_status:
-                        result.ai_status = "can_enrich"
-
-                    if not style_instruction:
-                        self.storage.save(song_id, provider, result)
-                    return result
+                    return await self._finalize_lyrics(result, song_id, provider, metadata, style_instruction)
                 except ParsingError:
                     # Fallback to LRC parsing if XML failed?
                     pass
             
             # 3. Simple LRC parsing fallback
-            from app.schemas.models import Line
-            lines = []
-            for line_str in decrypted_xml.splitlines():
-                line_str = line_str.strip()
-                if not line_str: continue
-                # Basic LRC regex: [mm:ss.xx]Text
-                import re
-                match = re.search(r'\[(\d+):(\d+(\.\d+)?)\](.*)', line_str)
-                if match:
-                    minutes = int(match.group(1))
-                    seconds = float(match.group(2))
-                    text = match.group(4).strip()
-                    time_sec = minutes * 60 + seconds
-                    lines.append(Line(st=time_sec, et=time_sec, txt=text, words=[]))
+            lines = [
+                Line.model_construct(st=time_sec, et=time_sec, txt=txt, words=[])
+                for time_sec, txt in _parse_lrc(lrc_bytes if lrc_bytes is not None else decrypted_xml)
+            ]
             
             if lines:
-                result = LyricsData(lines=lines)
-                
-                # Phase 4.5: Metadata & Cleaning
-                if metadata:
-                    result.metadata = metadata
-                
-                result = LyricsCleaner.clean(result)
-                result = LyricsUncensor.uncensor_lyrics(result)
-                
-                # Phase 3: AI Enrichment (Decoupled)
-                if not result.ai_status:
-                    result.ai_status = "can_enrich"
-
-                if not style_instruction:
-                    self.storage.save(song_id, provider, result)
-                return result
+                return await self._finalize_lyrics(LyricsData(lines=lines), song_id, provider, metadata, style_instruction)
             
             if is_lrc:
                  logger.warning("LRC parsing failed or no lyrics found.")
@@ -376,6 +511,126 @@ class LyricsService:
             logger.error(f"Parsing failed: {e}")
             return None
 
+    async def _build_translation_strategies(self, metadata: SongMetadata) -> List[SongMetadata]:
+        """
+        Build the translation-based fallback strategies, translating concurrently:
+        - Romaji -> Japanese (input is likely Romaji)
+        - English -> Chinese (input is ASCII)
+        """
+        if not has_translator or not (metadata.artist.isascii() and metadata.title.isascii()):
+            return []
+        
+        romaji_meta, zh_pair = await asyncio.gather(
+            self._detect_and_translate_romaji(metadata.artist, metadata.title),
+            self._translate_pair(metadata.artist, metadata.title, 'zh-CN'),
+            return_exceptions=True
+        )
+        
+        strategies = []
+        if isinstance(romaji_meta, SongMetadata):
+            logger.info("Strategy: Romaji detected, adding Japanese search query.")
+            strategies.append(romaji_meta)
+        
+        if isinstance(zh_pair, tuple):
+            zh_artist, zh_title = zh_pair
+            if zh_artist != metadata.artist or zh_title != metadata.title:
+                logger.info(f"Strategy: Adding EN->ZH fallback: {zh_artist} - {zh_title}")
+                strategies.append(SongMetadata(title=zh_title, artist=zh_artist))
+        
+        return strategies
+
+    async def _run_search_strategies(self, search_queue: List[SongMetadata], candidates: List[_Candidate], seen_queries: set) -> bool:
+        """
+        Search with each strategy in order, scoring results into `candidates`.
+        Queries already in `seen_queries` (e.g. a translation that came back unchanged) are skipped.
+        
+        Returns:
+            True once a strategy yields a strong match (no further strategies needed).
+        """
+        for meta in search_queue:
+            query_key = (meta.title.lower(), meta.artist.lower())
+            if query_key in seen_queries:
+                logger.info(f"Skipping duplicate search query: {meta.artist} - {meta.title}")
+                continue
+            seen_queries.add(query_key)
+            
+            logger.info(f"Searching with metadata: {meta.artist} - {meta.title}")
+            search_key = self.storage.search_key(meta.title, meta.artist)
+            results = self.storage.load_search(search_key)
+            if results is None:
+                results = await self.aggregator.search_all(meta)
+                # Empty results may be transient (timeouts), so only hits are cached
+                if results:
+                    self.storage.cache_search(search_key, results)
+            else:
+                logger.info("Search cache hit.")
+            
+            if not results:
+                continue
+            
+            logger.info(f"Found {len(results)} candidates for strategy.")
+            
+            # Score and Filter
+            # Normalize the query and every candidate once per strategy; all scorers share these
+            meta_title_l = meta.title.lower()
+            meta_artist_l = meta.artist.lower()
+            titles_l = [res.title.lower() for res in results]
+            artists_l = [res.artist.lower() for res in results]
+            if fuzz:
+                # Score against current search query (meta) to handle Translation/Romaji strategies.
+                # Each field is scored against all candidates in one rapidfuzz call.
+                # Titles that cannot reach the threshold even with a perfect artist score are pruned:
+                # title * 0.6 + 100 * 0.4 >= 60 needs title >= 33.3; title-only needs title >= 60.
+                title_cutoff = (60 - 100 * 0.4) / 0.6 if meta.artist else 60
+                title_scores = _batch_scores(meta_title_l, titles_l, fuzz.ratio, score_cutoff=title_cutoff)
+                
+                # Fast path: an exact title + artist match scores 100 on every scorer. If a syllable
+                # provider has one, keep the exact matches and skip scoring the rest of the batch.
+                exact_hits = [
+                    res for res, title_score, artist_l in zip(results, title_scores, artists_l)
+                    if title_score == 100 and artist_l == meta_artist_l
+                ]
+                if any(_is_syllable_provider(res) for res in exact_hits):
+                    logger.info(f"Exact syllable match found. Skipping scoring of remaining {len(results) - len(exact_hits)} candidates.")
+                    candidates.extend(_Candidate(_is_syllable_provider(res), 100.0, res) for res in exact_hits)
+                    return True
+                
+                if not meta.artist:
+                    # Title Only Strategy: Ignore artist score
+                    scores = title_scores
+                else:
+                    # Use average of ratio (strict) and token_set_ratio (lenient)
+                    # This ensures exact artist matches (Doja Cat vs Doja Cat) score higher 
+                    # than partial matches (Doja Cat vs Doja Cat / Lin Yanjun)
+                    # Artists are only scored for candidates whose title survived the cutoff
+                    survivors = [i for i, title_score in enumerate(title_scores) if title_score]
+                    survivor_artists = [artists_l[i] for i in survivors]
+                    ratios = _batch_scores(meta_artist_l, survivor_artists, fuzz.ratio)
+                    token_sets = _batch_scores(meta_artist_l, survivor_artists, fuzz.token_set_ratio)
+                    scores = [0.0] * len(results)
+                    for i, ratio, token_set in zip(survivors, ratios, token_sets):
+                        scores[i] = (title_scores[i] * 0.6) + ((ratio + token_set) / 2 * 0.4)
+            else:
+                # Share of query title tokens present in the candidate title
+                meta_tokens = set(meta_title_l.split())
+                scores = [
+                    100 * len(meta_tokens & set(title_l.split())) / max(len(meta_tokens), 1)
+                    for title_l in titles_l
+                ]
+            
+            current_batch = []
+            for res, score in zip(results, scores):
+                if score >= 60: # Threshold
+                    current_batch.append(_Candidate(_is_syllable_provider(res), score, res))
+            
+            if current_batch:
+                candidates.extend(current_batch)
+                best_score = max(c.score for c in current_batch)
+                if best_score > 80:
+                    return True
+
+        return False
+
     async def match_best_lyrics(self, metadata) -> Optional[LyricsData]:
 
         """
@@ -387,125 +642,74 @@ class LyricsService:
         3. Duration Match (within 3s)
         """
         # 1. Search Strategies
-        # 1. Search Strategies
+        # Cheap strategies run first. The translation-based ones cost Google Translate
+        # round-trips, so they are only built when these produce no strong match.
         search_queue = []
         
-        # Strategy A: Romaji -> Japanese (High Priority if detected)
-        # Check if input is likely Romaji
-        romaji_meta = self._detect_and_translate_romaji(metadata.artist, metadata.title)
-        if romaji_meta:
-             logger.info("Strategy: Romaji detected, adding Japanese search query first.")
-             search_queue.append(romaji_meta)
-        
-        # Strategy B: Strict Search (Original Metadata)
+        # Strategy A: Strict Search (Original Metadata)
         search_queue.append(metadata)
         
-        # Strategy C: Simplified Artist
+        # Strategy B: Simplified Artist
         simple_artist = self._simplify_artist(metadata.artist)
         if simple_artist != metadata.artist and simple_artist:
              search_queue.append(metadata.model_copy(update={"artist": simple_artist}))
              
-        # Strategy D: Title Only (Last resort)
+        # Strategy C: Title Only
         if metadata.title:
              search_queue.append(metadata.model_copy(update={"artist": ""}))
              
-        # Strategy E: English -> Chinese Fallback (Low Priority)
-        # If original is English (detect ascii), try Chinese translation.
-        # Only if strict search failed (though this queue handles all).
-        # We put it at the end.
-        if all(ord(c) < 128 for c in metadata.artist + metadata.title) and has_translator:
-             try:
-                 zh_artist = self._translate_text(metadata.artist, 'zh-CN')
-                 zh_title = self._translate_text(metadata.title, 'zh-CN')
-                 if zh_artist != metadata.artist or zh_title != metadata.title:
-                     logger.info(f"Strategy: Adding EN->ZH fallback: {zh_artist} - {zh_title}")
-                     search_queue.append(SongMetadata(title=zh_title, artist=zh_artist))
-             except Exception:
-                 pass
-             
-        candidates = []
-        scored_candidates = [] 
+        candidates: List[_Candidate] = []
+        # (title, artist) pairs already searched, shared across all strategies
+        seen_queries = set()
         
-        for meta in search_queue:
-            logger.info(f"Searching with metadata: {meta.artist} - {meta.title}")
-            results = await self.aggregator.search_all(meta)
-            
-            if not results:
-                continue
-            
-            logger.info(f"Found {len(results)} candidates for strategy.")
-            
-            # Score and Filter
-            current_batch = []
-            for res in results:
-                # Score Calculation
-                score = 0
-                if fuzz:
-                    # Score against current search query (meta) to handle Translation/Romaji strategies
-                    title_score = fuzz.ratio(meta.title.lower(), res.title.lower())
-                    
-                    if not meta.artist:
-                        # Title Only Strategy: Ignore artist score
-                        score = title_score
-                    else:
-                        # Use average of ratio (strict) and token_set_ratio (lenient)
-                        # This ensures exact artist matches (Doja Cat vs Doja Cat) score higher 
-                        # than partial matches (Doja Cat vs Doja Cat / Lin Yanjun)
-                        ratio = fuzz.ratio(meta.artist.lower(), res.artist.lower())
-                        token_set = fuzz.token_set_ratio(meta.artist.lower(), res.artist.lower())
-                        artist_score = (ratio + token_set) / 2
-                        
-                        score = (title_score * 0.6) + (artist_score * 0.4)
-                else:
-                    score = 100 if metadata.title in res.title else 50
-                
-                is_syllable_provider = res.provider.lower() in ['qq music', 'kugou', 'qq', 'kugou music']
-                
-                if score >= 60: # Threshold
-                    current_batch.append({
-                        'is_syllable': is_syllable_provider,
-                        'score': score,
-                        'result': res
-                    })
-            
-            if current_batch:
-                candidates.extend(current_batch)
-                best_score = max(c['score'] for c in current_batch)
-                if best_score > 80:
-                    break
+        if not await self._run_search_strategies(search_queue, candidates, seen_queries):
+            # Strategies D/E: Romaji -> Japanese, English -> Chinese (Last resort)
+            await self._run_search_strategies(await self._build_translation_strategies(metadata), candidates, seen_queries)
         
         if not candidates:
              logger.info("No valid candidates found after all search strategies.")
              return None
              
-        # Sort All Candidates
-        candidates.sort(key=lambda x: (x['is_syllable'], x['score']), reverse=True)
-        logger.info(f"Top 5 Candidates: {[(c['result'].provider, c['score'], c['is_syllable']) for c in candidates[:5]]}")
-        
-        scored_candidates = candidates
-        
-        # 3. Sequential Fetch: Get lyrics from top candidates one by one
-        # Prioritize strict score order and avoid unnecessary API calls or concurrency blocks.
+        # 3. Fetch: Get lyrics from top candidates
+        # Up to FETCH_WAVE_SIZE downloads stay in flight ahead of the consumer, but results are
+        # still consumed in strict score order: the top candidate returns as soon as it is valid,
+        # and a slow or instrumental one no longer delays the next.
+        # Only the top few are ever read, so select them with a bounded heap instead of a full sort.
         MAX_CANDIDATES = 5
-        top_candidates = scored_candidates[:MAX_CANDIDATES]
-        logger.info(f"Fetching lyrics from top {len(top_candidates)} candidates sequentially...")
+        FETCH_WAVE_SIZE = 3
+        top_candidates = heapq.nlargest(MAX_CANDIDATES, candidates, key=lambda x: (x.is_syllable, x.score))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Top {MAX_CANDIDATES} Candidates: {[(c.result.provider, c.score, c.is_syllable) for c in top_candidates]}")
         
-        best_instrumental_candidate = None
-        
-        for candidate_data in top_candidates:
-            res = candidate_data['result']
-            logger.info(f"Attempting candidate: {res.provider} | {res.title} (Score: {candidate_data['score']})")
-            
+        ai_config = getattr(metadata, 'ai_config', None)
+        style_instruction = getattr(metadata, 'style_instruction', None)
+
+        async def fetch_candidate(candidate_data: _Candidate) -> Optional[LyricsData]:
+            res = candidate_data.result
+            logger.info(f"Attempting candidate: {res.provider} | {res.title} (Score: {candidate_data.score})")
             try:
-                ai_config = getattr(metadata, 'ai_config', None)
-                style_instruction = getattr(metadata, 'style_instruction', None)
-                
-                lyrics_data = await self.get_standardized_lyrics(
+                return await self.get_standardized_lyrics(
                     res.id, res.provider,
                     style_instruction=style_instruction,
                     ai_config=ai_config,
                     metadata=metadata
                 )
+            except Exception as e:
+                logger.warning(f"Error fetching candidate {res.title}: {e}")
+                return None
+
+        logger.info(f"Fetching lyrics from top {len(top_candidates)} candidates ({FETCH_WAVE_SIZE} concurrently)...")
+        fetch_tasks: List[asyncio.Task] = []
+        
+        best_instrumental_candidate = None
+        
+        try:
+            for index, candidate_data in enumerate(top_candidates):
+                res = candidate_data.result
+                # Slide the window: prefetch the next candidates as each one is consumed
+                while len(fetch_tasks) < min(index + FETCH_WAVE_SIZE, len(top_candidates)):
+                    fetch_tasks.append(asyncio.create_task(fetch_candidate(top_candidates[len(fetch_tasks)])))
+                lyrics_data = await fetch_tasks[index]
                 
                 if not lyrics_data:
                     logger.warning(f"Candidate {res.title} returned no lyrics.")
@@ -521,14 +725,14 @@ class LyricsService:
                 else:
                     logger.info(f"Found valid Lyrics: {res.title}")
                     return lyrics_data
-
-            except Exception as e:
-                logger.warning(f"Error fetching candidate {res.title}: {e}")
-                continue
+        finally:
+            # Lower-ranked downloads still in flight are no longer needed
+            for task in fetch_tasks:
+                if not task.done():
+                    task.cancel()
 
         if best_instrumental_candidate:
             logger.info("No vocal lyrics found. Returning best instrumental candidate.")
             return best_instrumental_candidate
              
         return None
-
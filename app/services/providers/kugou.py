@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import httpx
 import json
@@ -55,28 +56,31 @@ class KugouProvider(BaseProvider):
                 album_name = item.get("album_name")
                 duration = item.get("duration", 0)
                 
-                duration_ms = duration * 1000
-                safe_title = songname.replace("|", "")
-                composite_id = f"{hash_val}|{duration_ms}|{safe_title}"
+                if not hash_val or not songname:
+                    continue
                 
-                if hash_val and songname:
-                    result = SearchResult(
-                        provider=self.provider_name,
-                        id=composite_id,
-                        title=songname,
-                        artist=singername,
-                        album=album_name if album_name else "",
-                        songmid=hash_val,
-                        media_mid="",
-                    )
-                    results.append(result)
+                # Hash and duration never contain '|', so the title is kept verbatim;
+                # get_lyric_content splits at most twice
+                composite_id = f"{hash_val}|{duration * 1000}|{songname}"
+                
+                result = SearchResult(
+                    provider=self.provider_name,
+                    id=composite_id,
+                    title=songname,
+                    artist=singername,
+                    album=album_name if album_name else "",
+                    songmid=hash_val,
+                    media_mid="",
+                )
+                results.append(result)
                     
             return results
             
         except httpx.HTTPError as e:
             logger.error(f"Kugou search failed: {e}")
             return []
-        except Exception as e:
+        # Malformed response payloads; anything else is a bug and surfaces in Aggregator's logs
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
             logger.error(f"Kugou search unexpected error: {e}")
             return []
 
@@ -85,7 +89,7 @@ class KugouProvider(BaseProvider):
         # Handle backward compatibility or loose parsing
         title = ""
         try:
-            parts = id.split("|")
+            parts = id.split("|", 2)
             if len(parts) == 3:
                 hash_val, duration_ms, title = parts
             elif len(parts) == 2:
@@ -112,51 +116,59 @@ class KugouProvider(BaseProvider):
         logger.info(f"Fetching Kugou Lyric Info: {search_url} for hash {hash_val}")
         
         try:
-            client = self.client
-            search_resp = await client.get(search_url, params=search_params, headers=self.headers, timeout=self.timeout)
-            search_resp.raise_for_status()
-            search_data = search_resp.json()
-            
-            candidates = search_data.get("candidates", [])
-            if not candidates:
-                logger.warning("No lyric candidates found on Kugou.")
-                return b""
-            
-            candidate = candidates[0] 
-            cand_id = candidate.get("id")
-            access_key = candidate.get("accesskey")
-            
-            if not cand_id or not access_key:
-                logger.error("Candidate missing id or accesskey")
-                return b""
-            
-            # Step 3: Download Content
-            download_url = "http://lyrics.kugou.com/download"
-            download_params = {
-                "ver": "1",
-                "client": "pc",
-                "id": cand_id,
-                "accesskey": access_key,
-                "fmt": "krc",
-                "charset": "utf8"
-            }
-            
-            logger.info(f"Downloading Kugou Lyric Content: {download_url} id={cand_id}")
-            
-            dl_resp = await client.get(download_url, params=download_params, headers=self.headers, timeout=self.timeout)
-            dl_resp.raise_for_status()
-            dl_data = dl_resp.json()
-            
-            content_b64 = dl_data.get("content")
-            if not content_b64:
-                logger.warning("Download response missing 'content' field.")
-                return b""
-                
-            return base64.b64decode(content_b64)
-
+            # One budget for the search + download chain, so chained steps can't each use a full timeout.
+            # wait_for rather than asyncio.timeout(), which needs Python 3.11.
+            return await asyncio.wait_for(self._download_krc(search_url, search_params), self.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Kugou lyric download timed out after {self.timeout}s")
+            return b""
         except httpx.HTTPError as e:
             logger.error(f"Kugou lyric download failed: {e}")
             return b""
         except Exception as e:
             logger.error(f"Kugou lyric download unexpected error: {e}")
             return b""
+
+    async def _download_krc(self, search_url: str, search_params: dict) -> bytes:
+        """Look up the lyric candidate, then download its base64 KRC content."""
+        client = self.client
+        search_resp = await client.get(search_url, params=search_params, headers=self.headers)
+        search_resp.raise_for_status()
+        search_data = search_resp.json()
+
+        candidates = search_data.get("candidates", [])
+        if not candidates:
+            logger.warning("No lyric candidates found on Kugou.")
+            return b""
+
+        candidate = candidates[0] 
+        cand_id = candidate.get("id")
+        access_key = candidate.get("accesskey")
+
+        if not cand_id or not access_key:
+            logger.error("Candidate missing id or accesskey")
+            return b""
+
+        # Step 3: Download Content
+        download_url = "http://lyrics.kugou.com/download"
+        download_params = {
+            "ver": "1",
+            "client": "pc",
+            "id": cand_id,
+            "accesskey": access_key,
+            "fmt": "krc",
+            "charset": "utf8"
+        }
+
+        logger.info(f"Downloading Kugou Lyric Content: {download_url} id={cand_id}")
+
+        dl_resp = await client.get(download_url, params=download_params, headers=self.headers)
+        dl_resp.raise_for_status()
+        dl_data = dl_resp.json()
+
+        content_b64 = dl_data.get("content")
+        if not content_b64:
+            logger.warning("Download response missing 'content' field.")
+            return b""
+
+        return base64.b64decode(content_b64)
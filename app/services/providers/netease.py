@@ -25,17 +25,24 @@ class NeteaseProvider(BaseProvider):
         Search using the simple GET API (more reliable, works without encryption).
         Reference: Lyricify-Lyrics-Helper Api.cs line 50
         """
-        import urllib.parse
-        
         keyword = f"{metadata.title} {metadata.artist}"
-        encoded_keyword = urllib.parse.quote(keyword)
         
-        # Simple GET API - no encryption needed
-        url = f"http://music.163.com/api/search/get/web?csrf_token=hlpretag=&hlposttag=&s={encoded_keyword}&type=1&offset=0&total=true&limit=20"
+        # Simple GET API - no encryption needed; httpx encodes the query params
+        url = "http://music.163.com/api/search/get/web"
+        params = {
+            "csrf_token": "",
+            "hlpretag": "",
+            "hlposttag": "",
+            "s": keyword,
+            "type": 1,
+            "offset": 0,
+            "total": "true",
+            "limit": 20
+        }
         
         try:
             client = self.client
-            response = await client.get(url, headers=self.headers, timeout=self.timeout)
+            response = await client.get(url, params=params, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             resp_json = response.json()
             
@@ -84,9 +91,13 @@ class NeteaseProvider(BaseProvider):
                 ))
             return results
 
-        except Exception as e:
+        except httpx.HTTPError as e:
             logger.error(f"Netease search error: {e}")
             return []
+        # Malformed response payloads; anything else is a bug and surfaces in Aggregator's logs
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.error(f"Netease search returned an unexpected payload: {e}")
+            return []
 
     async def get_lyric_content(self, id: str, **kwargs) -> bytes:
         url = "https://music.163.com/weapi/song/lyric?csrf_token="
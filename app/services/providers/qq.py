@@ -1,12 +1,52 @@
 import httpx
 import json
 import logging
+import operator
+import re
 from typing import List, Optional, Union, Dict
 import time
 from app.services.providers.base import BaseProvider, SongMetadata, SearchResult
 
 logger = logging.getLogger(__name__)
 
+# id and name of a search hit, fetched in one call
+_song_required = operator.itemgetter("id", "name")
+
+# One pass over the lyric XML picks up every field. Longer tag names come first so that
+# <contentts>/<contentroma> are not swallowed by <content>; <lyric...> stays a prefix match.
+# The response arrives wrapped in <!-- ... -->; tags are found anywhere, a comment opener
+# right after a tag is skipped, and bare text stops at '-' (never part of hex), so the
+# markers need no stripping pass.
+_RE_LYRIC_FIELD = re.compile(
+    r'<(contentts|contentroma|content|lyric)[^>]*>(?:<!--)?(?:<!\[CDATA\[(.*?)\]\]>|([^<\-]*))',
+    re.DOTALL | re.IGNORECASE,
+)
+# Once all of these have been seen, the rest of the response carries no lyric data
+_LYRIC_FIELD_CLOSE_TAGS = (b"</content>", b"</contentts>", b"</contentroma>")
+_MAX_CLOSE_TAG_LEN = max(len(tag) for tag in _LYRIC_FIELD_CLOSE_TAGS)
+# Fields whose hex may also appear as bare text instead of CDATA
+_RAW_LYRIC_FIELDS = ("content", "contentts")
+
+def _extract_lyric_fields(content_str: str) -> Dict[str, str]:
+    """
+    Scan the lyric_download response once and map tag name -> hex payload.
+    The first non-blank value of each tag wins. Values are not stripped: bytes.fromhex()
+    skips ASCII whitespace itself, so copying multi-KB hex strings here buys nothing.
+    """
+    fields: Dict[str, str] = {}
+    for m in _RE_LYRIC_FIELD.finditer(content_str):
+        tag = m.group(1).lower()
+        if tag in fields:
+            continue
+        value = m.group(2)
+        if value is None:
+            if tag not in _RAW_LYRIC_FIELDS:
+                continue
+            value = m.group(3)
+        if value and not value.isspace():
+            fields[tag] = value
+    return fields
+
 class QQMusicProvider(BaseProvider):
     @property
     def provider_name(self) -> str:
@@ -46,26 +86,30 @@ class QQMusicProvider(BaseProvider):
             song_list = data.get("req_1", {}).get("data", {}).get("body", {}).get("song", {}).get("list", [])
             
             for song in song_list:
-                song_mid = song.get("mid")
-                song_id_num = song.get("id")
-                media_mid = song.get("file", {}).get("media_mid")
-                title = song.get("name")
-                album = song.get("album", {}).get("name")
+                # Required fields first: songs without an id or name are skipped before
+                # any of the optional lookups below
+                try:
+                    song_id_num, title = _song_required(song)
+                except KeyError:
+                    continue
+                if not song_id_num or not title:
+                    continue
                 
+                album = (song.get("album") or {}).get("name")
                 singers = song.get("singer", [])
-                artist = ", ".join([s.get("name") for s in singers])
+                # Skip nameless singer entries instead of letting None break join()
+                artist = ", ".join(s["name"] for s in singers if s.get("name"))
                 
-                if song_id_num and title:
-                    result = SearchResult(
-                        provider=self.provider_name,
-                        id=str(song_id_num),
-                        title=title,
-                        artist=artist,
-                        album=album if album else "",
-                        songmid=song_mid, 
-                        media_mid=media_mid
-                    )
-                    results.append(result)
+                result = SearchResult(
+                    provider=self.provider_name,
+                    id=str(song_id_num),
+                    title=title,
+                    artist=artist,
+                    album=album if album else "",
+                    songmid=song.get("mid"), 
+                    media_mid=(song.get("file") or {}).get("media_mid")
+                )
+                results.append(result)
                     
             return results
 
@@ -106,52 +150,35 @@ class QQMusicProvider(BaseProvider):
 
         try:
             client = self.client
-            response = await client.post(url, data=params, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            
-            content_str = response.text
-            content_str = content_str.replace("<!--", "").replace("-->", "")
+            # Stream the body and stop once every lyric field has closed, rather than
+            # always buffering the whole envelope first
+            buf = bytearray()
+            pending = set(_LYRIC_FIELD_CLOSE_TAGS)
+            async with client.stream("POST", url, data=params, headers=headers, timeout=self.timeout) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    # Re-scan a small overlap so a tag split across chunks is still found
+                    scan_from = max(0, len(buf) - _MAX_CLOSE_TAG_LEN)
+                    buf += chunk
+                    pending = {tag for tag in pending if buf.find(tag, scan_from) < 0}
+                    if not pending:
+                        break
             
-            import re
+            content_str = buf.decode('utf-8', errors='replace')
             
-            hex_str = ""
+            fields = _extract_lyric_fields(content_str)
             
-            # Pattern for CDATA wrapped content
-            match_cdata = re.search(r'<content[^>]*><!\[CDATA\[(.*?)\]\]>', content_str, re.DOTALL | re.IGNORECASE)
-            if match_cdata:
-                hex_str = match_cdata.group(1).strip()
+            # <content> first, then a CDATA-wrapped <lyric...> as fallback
+            hex_str = fields.get("content") or fields.get("lyric", "")
             
-            if not hex_str:
-                match_simple = re.search(r'<content[^>]*>(.*?)</content>', content_str, re.DOTALL | re.IGNORECASE)
-                if match_simple:
-                    candidate = match_simple.group(1).strip()
-                    if not candidate.startswith("<![CDATA["): 
-                        hex_str = candidate
-                        
-            if not hex_str:
-                 match_lyric_cdata = re.search(r'<lyric[^>]*><!\[CDATA\[(.*?)\]\]>', content_str, re.DOTALL | re.IGNORECASE)
-                 if match_lyric_cdata:
-                     hex_str = match_lyric_cdata.group(1).strip()
-
             # Extract translation hex
-            trans_hex = ""
-            trans_match_cdata = re.search(r'<contentts[^>]*><!\[CDATA\[(.*?)\]\]>', content_str, re.DOTALL | re.IGNORECASE)
-            if trans_match_cdata:
-                trans_hex = trans_match_cdata.group(1).strip()
+            trans_hex = fields.get("contentts", "")
+            if trans_hex:
                 logger.info(f"Found Translation Hex in <contentts>. Length: {len(trans_hex)}")
-            else:
-                trans_match_simple = re.search(r'<contentts[^>]*>(.*?)</contentts>', content_str, re.DOTALL | re.IGNORECASE)
-                if trans_match_simple:
-                    candidate = trans_match_simple.group(1).strip()
-                    if not candidate.startswith("<![CDATA["):
-                        trans_hex = candidate
-                        logger.info(f"Found Translation Hex in <contentts>. Length: {len(trans_hex)}")
             
             # Check for romaji
-            roma_hex = ""
-            roma_match = re.search(r'<contentroma[^>]*><!\[CDATA\[(.*?)\]\]>', content_str, re.DOTALL | re.IGNORECASE)
-            if roma_match:
-                roma_hex = roma_match.group(1).strip()
+            roma_hex = fields.get("contentroma", "")
+            if roma_hex:
                 logger.info(f"Found Romaji Hex in <contentroma>. Length: {len(roma_hex)}")
 
             if hex_str:
@@ -2,19 +2,42 @@ import os
 import hashlib
 import json
 import logging
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from app.schemas.models import LyricsData
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4096)
+def _filename_for(data_dir: str, song_id: str, provider: str) -> str:
+    """Cache file path for a song; memoized since the same songs are looked up repeatedly."""
+    # Normalize inputs for consistency
+    raw_key = f"{provider.lower()}_{song_id}"
+    hash_key = hashlib.blake2b(raw_key.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(data_dir, f"{hash_key}.json")
+
+def _legacy_filename_for(data_dir: str, song_id: str, provider: str) -> str:
+    """Cache file path under the old md5 naming, used to migrate files written before blake2b."""
+    raw_key = f"{provider.lower()}_{song_id}"
+    hash_key = hashlib.md5(raw_key.encode('utf-8')).hexdigest()
+    return os.path.join(data_dir, f"{hash_key}.json")
+
 class StorageService:
     """
     Service for storing and retrieving LyricsData objects as JSON files.
     """
     DATA_DIR = "data/lyrics"
+    # Search results are cheap and tolerate brief staleness; kept in memory only
+    SEARCH_CACHE_TTL = 120  # seconds
+    SEARCH_CACHE_SIZE = 512
 
     def __init__(self):
         self._ensure_data_dir()
+        # key -> (expires_at, results), in LRU order
+        self._search_cache: "OrderedDict[str, Tuple[float, List]]" = OrderedDict()
 
     def _ensure_data_dir(self):
         """Ensure the data directory exists."""
@@ -27,10 +50,7 @@ class StorageService:
 
     def _get_filename(self, song_id: str, provider: str) -> str:
         """Generate a unique filename based on provider and song ID."""
-        # Normalize inputs for consistency
-        raw_key = f"{provider.lower()}_{song_id}"
-        hash_key = hashlib.md5(raw_key.encode('utf-8')).hexdigest()
-        return os.path.join(self.DATA_DIR, f"{hash_key}.json")
+        return _filename_for(self.DATA_DIR, song_id, provider)
 
     def save(self, song_id: str, provider: str, data: LyricsData) -> bool:
         """
@@ -44,15 +64,28 @@ class StorageService:
         Returns:
             True if successful, False otherwise.
         """
+        tmp_path = None
         try:
             filepath = self._get_filename(song_id, provider)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Use model_dump_json() for efficient serialization
-                f.write(data.model_dump_json(indent=2))
-            logger.debug(f"Saved lyrics to cache: {filepath}")
+            # Write a temp file and rename it into place: a crash mid-write can't leave a torn
+            # JSON behind. Unique per thread so concurrent saves of one song don't collide.
+            # No fsync; this is a cache, not durable storage.
+            tmp_path = f"{filepath}.{threading.get_ident()}.tmp"
+            # Compact model_dump_json(): no indent, so files are less than half the size
+            payload = data.model_dump_json().encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
+            tmp_path = None
+            logger.debug("Saved lyrics to cache: %s", filepath)
             return True
         except Exception as e:
             logger.error(f"Failed to save lyrics cache for {song_id} ({provider}): {e}")
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             return False
 
     def load(self, song_id: str, provider: str) -> Optional[LyricsData]:
@@ -67,13 +100,67 @@ class StorageService:
             LyricsData object or None if not found/error.
         """
         filepath = self._get_filename(song_id, provider)
-        if not os.path.exists(filepath):
+        if not os.path.exists(filepath) and not self._migrate_legacy(song_id, provider, filepath):
             return None
             
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
+            # model_validate_json parses bytes directly, no str decode needed
+            with open(filepath, 'rb') as f:
                 json_data = f.read()
                 return LyricsData.model_validate_json(json_data)
         except Exception as e:
             logger.error(f"Failed to load lyrics cache from {filepath}: {e}")
             return None
+
+    def _migrate_legacy(self, song_id: str, provider: str, filepath: str) -> bool:
+        """
+        Move a file saved under the old md5 name to its current name.
+        
+        Returns:
+            True if the file now exists under `filepath`.
+        """
+        legacy_path = _legacy_filename_for(self.DATA_DIR, song_id, provider)
+        if not os.path.exists(legacy_path):
+            return False
+        try:
+            os.replace(legacy_path, filepath)
+        except OSError as e:
+            # A concurrent load may have moved it already
+            if not os.path.exists(filepath):
+                logger.error(f"Failed to migrate lyrics cache {legacy_path} -> {filepath}: {e}")
+                return False
+        logger.debug("Migrated legacy lyrics cache: %s -> %s", legacy_path, filepath)
+        return True
+
+    @staticmethod
+    def search_key(title: str, artist: str) -> str:
+        """Generate a search cache key from normalized metadata."""
+        raw_key = f"{title.lower()}\x00{artist.lower()}"
+        return "search:" + hashlib.blake2b(raw_key.encode('utf-8'), digest_size=8).hexdigest()
+
+    def cache_search(self, key: str, results: List, ttl: float = SEARCH_CACHE_TTL) -> None:
+        """
+        Cache search results in memory for `ttl` seconds.
+        The least recently used entry is evicted once SEARCH_CACHE_SIZE is exceeded.
+        """
+        self._search_cache[key] = (time.monotonic() + ttl, list(results))
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
+    def load_search(self, key: str) -> Optional[List]:
+        """
+        Load cached search results.
+        
+        Returns:
+            A copy of the results, or None if not cached or expired.
+        """
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at < time.monotonic():
+            del self._search_cache[key]
+            return None
+        self._search_cache.move_to_end(key)
+        return list(results)
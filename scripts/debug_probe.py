@@ -5,8 +5,8 @@ async def probe():
     url = "http://127.0.0.1:9000/v1/match"
     payload = {"title": "mild days", "artist": "羊文学"}
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(url, json=payload, timeout=20.0)
+        async with httpx.AsyncClient(trust_env=False) as client:
+            resp = await client.post(url, json=payload, timeout=httpx.Timeout(20.0, connect=2.0))
             print(f"Status: {resp.status_code}")
             print(f"Body: {resp.text[:200]}")
     except Exception as e:
@@ -8,12 +8,12 @@ from datetime import datetime
 # Determine script directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Characters invalid in filenames -> '_', applied in one str.translate pass
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 def sanitize_filename(name):
     """Remove characters that are invalid in filenames."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '_')
-    return name
+    return name.translate(_SANITIZE_TABLE)
 
 def save_lyrics_file(output_dir, title, artist, data):
     """Save lyrics to a human-readable text file."""
@@ -26,8 +26,9 @@ def save_lyrics_file(output_dir, title, artist, data):
     lines_out.append("")
     
     for line in data.get("lines", []):
-        # Original text
-        txt = line.get("txt", "").strip()
+        # Original text (strip only non-empty values)
+        txt = line.get("txt")
+        txt = txt.strip() if txt else ""
         if txt:
             lines_out.append(txt)
         
@@ -44,12 +45,13 @@ def save_lyrics_file(output_dir, title, artist, data):
         if txt:
             lines_out.append("")
     
+    # Stream line by line rather than building one joined copy of the whole file
     with open(filepath, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines_out))
+        f.writelines(f"{l}\n" for l in lines_out)
     
     return filename
 
-async def test_song(api_url: str, title: str, artist: str, output_dir: str):
+async def test_song(client: httpx.AsyncClient, api_url: str, title: str, artist: str, output_dir: str):
     """Call the API and print results, then save to file."""
     print(f"\n🔍 Searching for: {title} - {artist} ...")
     
@@ -60,43 +62,45 @@ async def test_song(api_url: str, title: str, artist: str, output_dir: str):
     }
     
     start = time.perf_counter()
-    async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-        try:
-            resp = await client.post(f"{api_url}/v1/match", json=payload)
-            elapsed = time.perf_counter() - start
+    try:
+        resp = await client.post(f"{api_url}/v1/match", json=payload)
+        elapsed = time.perf_counter() - start
+        
+        if resp.status_code == 200:
+            data = resp.json()
+            lines = data.get("lines", [])
+            print(f"✅ Success ({elapsed:.2f}s)")
+            print(f"   Source: {data.get('source')}")
+            print(f"   Type:   {data.get('type')}")
+            print(f"   Score:  {data.get('match_score')}")
+            print(f"   Lines:  {len(lines)}")
             
-            if resp.status_code == 200:
-                data = resp.json()
-                lines = data.get("lines", [])
-                print(f"✅ Success ({elapsed:.2f}s)")
-                print(f"   Source: {data.get('source')}")
-                print(f"   Type:   {data.get('type')}")
-                print(f"   Score:  {data.get('match_score')}")
-                print(f"   Lines:  {len(lines)}")
-                
-                # Save to file
-                filename = save_lyrics_file(output_dir, title, artist, data)
-                print(f"   Saved:  {filename}")
-                
-                if lines:
-                    print("\n   --- Preview (First 5 lines) ---")
-                    for i, line in enumerate(lines[:5]):
-                        txt = line.get('txt', '').strip()
-                        trans = line.get('trans', '').strip()
-                        ts = f"[{line.get('st')} -> {line.get('et')}]"
-                        print(f"   {ts} {txt}")
-                        if trans:
-                            print(f"                  → {trans}")
-                    if len(lines) > 5:
-                        print(f"   ... and {len(lines)-5} more lines.")
-            else:
-                print(f"❌ Failed ({elapsed:.2f}s)")
-                print(f"   Status: {resp.status_code}")
-                print(f"   Error:  {resp.text}")
-                
-        except Exception as e:
-            print(f"❌ Error ({time.perf_counter() - start:.2f}s)")
-            print(f"   {e}")
+            # Save to file
+            filename = save_lyrics_file(output_dir, title, artist, data)
+            print(f"   Saved:  {filename}")
+            
+            if lines:
+                print("\n   --- Preview (First 5 lines) ---")
+                for i, line in enumerate(lines[:5]):
+                    txt = line.get('txt')
+                    txt = txt.strip() if txt else ""
+                    # trans may be present but null, so .get('trans', '') alone isn't enough
+                    trans = line.get('trans')
+                    trans = trans.strip() if trans else ""
+                    ts = f"[{line.get('st')} -> {line.get('et')}]"
+                    print(f"   {ts} {txt}")
+                    if trans:
+                        print(f"                  → {trans}")
+                if len(lines) > 5:
+                    print(f"   ... and {len(lines)-5} more lines.")
+        else:
+            print(f"❌ Failed ({elapsed:.2f}s)")
+            print(f"   Status: {resp.status_code}")
+            print(f"   Error:  {resp.text}")
+            
+    except Exception as e:
+        print(f"❌ Error ({time.perf_counter() - start:.2f}s)")
+        print(f"   {e}")
 
 async def main():
     print("=" * 60)
@@ -120,7 +124,15 @@ async def main():
     print("-" * 60)
     print("Enter songs in format: 'Title - Artist' (or 'q' to quit)")
     
-    # 3. Loop
+    # 3. Loop (one pooled client for the whole session)
+    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0, connect=5.0), trust_env=False) as client:
+        await _prompt_loop(client, api_url, output_dir)
+    
+    print("\nBye! 👋")
+    print(f"Results saved in: {output_dir}")
+
+async def _prompt_loop(client: httpx.AsyncClient, api_url: str, output_dir: str):
+    """Read 'Title - Artist' lines until the user quits."""
     while True:
         try:
             user_input = input("\n🎵 Song > ").strip()
@@ -137,7 +149,7 @@ async def main():
                     title = parts[0].strip()
                     artist = parts[1].strip()
                     # Pass output_dir to test_song
-                    await test_song(api_url, title, artist, output_dir)
+                    await test_song(client, api_url, title, artist, output_dir)
                 else:
                     print("⚠️  Format error. Please use 'Title - Artist'")
             else:
@@ -145,9 +157,6 @@ async def main():
                 
         except KeyboardInterrupt:
             break
-    
-    print("\nBye! 👋")
-    print(f"Results saved in: {output_dir}")
 
 if __name__ == "__main__":
     try:
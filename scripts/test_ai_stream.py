@@ -0,0 +1,59 @@
+import json
+import pytest
+from app.services.ai_service import _parse_json_items
+
+def _feed(chunks):
+    """Feed chunks the way _call_llm does: parse, then drop the consumed prefix."""
+    buffer = ""
+    items = []
+    for chunk in chunks:
+        buffer += chunk
+        parsed, consumed = _parse_json_items(buffer)
+        buffer = buffer[consumed:]
+        items.extend(parsed)
+    return items, buffer
+
+# --- Tests ---
+
+FULL = json.dumps({
+    "1.5": {"trans": "你好", "romaji": None, "explicit": False},
+    "3.0": {"trans": "world", "romaji": "wa-rudo", "explicit": True},
+}, ensure_ascii=False)
+
+@pytest.mark.parametrize("step", [1, 3, 7, len(FULL)])
+def test_split_chunks(step):
+    chunks = [FULL[i:i + step] for i in range(0, len(FULL), step)]
+    items, _ = _feed(chunks)
+
+    assert items == list(json.loads(FULL).items())
+
+def test_escaped_brackets_and_quotes_in_strings():
+    payload = {"1.0": {"trans": 'he said "}{" ]] [[ \\ done', "romaji": "a,b:c}"}}
+    full = json.dumps(payload)
+    items, _ = _feed(full[i:i + 2] for i in range(0, len(full), 2))
+
+    assert items == list(payload.items())
+
+def test_trailing_partial_item_left_in_buffer():
+    buffer = '{"1.0": {"trans": "a"}, "2.0": {"trans": "b'
+    items, consumed = _parse_json_items(buffer)
+
+    assert items == [("1.0", {"trans": "a"})]
+    assert buffer[consumed:].lstrip(", ") == '"2.0": {"trans": "b'
+
+def test_trailing_scalar_waits_for_delimiter():
+    # "12" could still grow into "123"; only accept it once something follows
+    items, consumed = _parse_json_items('{"1.0": 12')
+    assert items == []
+    assert consumed == 1
+
+    items, _ = _parse_json_items('{"1.0": 123}')
+    assert items == [("1.0", 123)]
+
+def test_malformed_item_is_not_emitted():
+    buffer = '{"1.0": {"trans": "a"}, "2.0": {"trans": }, "3.0": {"trans": "c"}}'
+    items, consumed = _parse_json_items(buffer)
+
+    # Entries before the malformed one survive; parsing stops there instead of raising
+    assert items == [("1.0", {"trans": "a"})]
+    assert buffer[consumed:].lstrip(", ").startswith('"2.0"')
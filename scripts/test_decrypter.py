@@ -2,6 +2,7 @@ import zlib
 import base64
 import pytest
 from Crypto.Cipher import DES3
+from Crypto.Util.Padding import pad
 from app.core.decrypter import QQMusicDecrypt, KugouDecrypt, DecryptionError
 
 # --- Helper Logic to Generate Mock Mock Data ---
@@ -16,21 +17,10 @@ def encrypt_qrc(text: str, key: bytes = QQMusicDecrypt.DEFAULT_KEY) -> str:
     compressed = zlib.compress(data)
     
     # 3. 3DES Encrypt (ECB)
-    # Pad to 8 bytes for DES3
-    pad_len = 8 - (len(compressed) % 8)
-    if pad_len != 8:
-        compressed += b'\x00' * pad_len # Zero padding is common for simple cases or PKCS5. 
-        # Reference C# code doesn't show explicit unpadding logic in `DecryptLyrics`, 
-        # but `SharpZipLib` might handle trailing zeros or the stream just stops at valid Zlib end.
-        # Let's see if simple zero padding works with zlib decompression on the other side.
-        # UPDATE: C# `TripleDESCrypt` loops `encryptedTextByte.Length; i += 8`.
-        # C# `SharpZipLibDecompress` takes the bytes.
-        # If we pad with zeros, zlib might complain about trailing garbage if not handled.
-        # Let's try standard padding.
-        pass
-    
+    # PKCS7-pad to the 8-byte block size; zlib stops at the end of its stream,
+    # so the decrypter never needs to strip the padding.
     cipher = DES3.new(key, DES3.MODE_ECB)
-    encrypted = cipher.encrypt(compressed)
+    encrypted = cipher.encrypt(pad(compressed, 8))
     
     # 4. Hex Encode
     return encrypted.hex().upper()
@@ -45,11 +35,12 @@ def encrypt_krc(text: str) -> str:
     compressed = zlib.compress(data)
     
     # 3. XOR Encrypt
+    # Tile the key to the payload length and XOR both as big integers in one C-level op;
+    # to_bytes with the fixed length keeps leading zero bytes.
     key = KugouDecrypt.MAGIC_KEY
-    key_len = len(key)
-    encrypted_payload = bytearray(compressed)
-    for i in range(len(encrypted_payload)):
-        encrypted_payload[i] ^= key[i % key_len]
+    n = len(compressed)
+    tiled_key = (key * (n // len(key) + 1))[:n]
+    encrypted_payload = (int.from_bytes(compressed, 'big') ^ int.from_bytes(tiled_key, 'big')).to_bytes(n, 'big')
         
     # 4. Prepend Header (4 bytes)
     full_data = b'krcl' + encrypted_payload # 'krcl' is a common magic header, content doesn't matter for logic
@@ -84,6 +75,13 @@ def test_krc_decrypt_success():
     decrypted = KugouDecrypt.decrypt(encrypted)
     assert decrypted == original_text
 
+def test_krc_decrypt_bytes_matches_base64():
+    original_text = "start_of_text\n[00:01.000]Test KRC"
+    encrypted = encrypt_krc(original_text)
+    
+    decrypted = KugouDecrypt.decrypt_bytes(base64.b64decode(encrypted))
+    assert decrypted == original_text
+
 def test_krc_decrypt_short_header_fails():
     # Base64 of "abc" (3 bytes) -> < 4 bytes header
     short_data = base64.b64encode(b'abc').decode('ascii')
@@ -0,0 +1,45 @@
+import pytest
+from app.core.parser import QrcParser
+from app.services.lyrics_service import _parse_lrc
+
+@pytest.fixture(params=[str, bytes], ids=["str", "bytes"])
+def as_input(request):
+    """_parse_lrc takes decoded text or raw UTF-8 bytes; run each test with both."""
+    if request.param is bytes:
+        return lambda text: text.encode('utf-8')
+    return lambda text: text
+
+# --- Tests ---
+
+def test_lrc_bom_first_line_kept(as_input):
+    content = as_input("\ufeff[00:01.00]first\n[00:02.00]second")
+
+    assert _parse_lrc(content) == [(1.0, "first"), (2.0, "second")]
+
+def test_lrc_cr_only_line_endings(as_input):
+    content = as_input("[00:01.00]a\r[00:02.00]b\r[00:03.00]c")
+
+    assert _parse_lrc(content) == [(1.0, "a"), (2.0, "b"), (3.0, "c")]
+
+def test_lrc_crlf_line_endings(as_input):
+    content = as_input("[00:01.00]a\r\n[00:02.00]b\r\n")
+
+    assert _parse_lrc(content) == [(1.0, "a"), (2.0, "b")]
+
+def test_lrc_multi_timestamp_expands(as_input):
+    content = as_input("[00:01.00][00:05.00]text")
+
+    assert _parse_lrc(content) == [(1.0, "text"), (5.0, "text")]
+
+@pytest.mark.parametrize("newline", ["\n", "\r", "\r\n"], ids=["lf", "cr", "crlf"])
+def test_lrc_multi_timestamp_bom_and_line_endings(as_input, newline):
+    content = as_input("\ufeff[00:01.00][00:05.00]chorus" + newline + "[00:03.00]verse")
+
+    assert _parse_lrc(content) == [(1.0, "chorus"), (3.0, "verse"), (5.0, "chorus")]
+
+@pytest.mark.parametrize("newline", ["\n", "\r", "\r\n"], ids=["lf", "cr", "crlf"])
+def test_qrc_trans_map_line_endings(newline):
+    # Regression: CR-only translation LRC used to collapse into a single entry
+    content = newline.join(["[00:01.00]one", "[00:02.00]two", "[00:03.00]three"])
+
+    assert QrcParser._build_trans_map(content) == {1.0: "one", 2.0: "two", 3.0: "three"}
@@ -0,0 +1,52 @@
+import asyncio
+import pytest
+from app.services.lyrics_service import LyricsService
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    # StorageService creates its data directory relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return LyricsService()
+
+# --- Tests ---
+
+def test_singleflight_new_caller_after_last_waiter_leaves(service):
+    calls = []
+
+    async def fake_fetch(song_id, provider, style_instruction, ai_config, metadata):
+        calls.append(song_id)
+        if len(calls) == 1:
+            await asyncio.Event().wait()  # first fetch never finishes on its own
+        return "fresh"
+
+    service._fetch_standardized_lyrics = fake_fetch
+
+    async def scenario():
+        first = asyncio.create_task(service.get_standardized_lyrics("1", "QQ Music"))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        # Same tick: the abandoned fetch is still cancelling
+        return await service.get_standardized_lyrics("1", "QQ Music")
+
+    assert asyncio.run(scenario()) == "fresh"
+    assert calls == ["1", "1"]
+    assert not service._inflight
+
+def test_singleflight_joins_running_fetch(service):
+    calls = []
+
+    async def fake_fetch(song_id, provider, style_instruction, ai_config, metadata):
+        calls.append(song_id)
+        await asyncio.sleep(0.01)
+        return None
+
+    service._fetch_standardized_lyrics = fake_fetch
+
+    async def scenario():
+        return await asyncio.gather(*(service.get_standardized_lyrics("1", "QQ Music") for _ in range(3)))
+
+    assert asyncio.run(scenario()) == [None, None, None]
+    assert calls == ["1"]
+    assert not service._inflight
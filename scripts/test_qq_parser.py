@@ -0,0 +1,44 @@
+import pytest
+from app.services.providers.qq import _extract_lyric_fields
+
+QRC_HEX = "A1B2C3D4"
+TRANS_HEX = "0F0E0D0C"
+
+# --- Tests ---
+
+def test_cdata_content():
+    xml = f'<!--<?xml version="1.0"?><QrcInfos><content><![CDATA[{QRC_HEX}]]></content></QrcInfos>-->'
+
+    assert _extract_lyric_fields(xml) == {"content": QRC_HEX}
+
+def test_bare_hex_content():
+    xml = f'<QrcInfos><content>{QRC_HEX}</content><contentts>{TRANS_HEX}</contentts></QrcInfos>'
+
+    assert _extract_lyric_fields(xml) == {"content": QRC_HEX, "contentts": TRANS_HEX}
+
+def test_contentts_before_content():
+    # <content[^>]*> used to match <contentts> too and take the translation as the lyric
+    xml = (f'<contentts><![CDATA[{TRANS_HEX}]]></contentts>'
+           f'<content><![CDATA[{QRC_HEX}]]></content>')
+
+    fields = _extract_lyric_fields(xml)
+    assert fields["content"] == QRC_HEX
+    assert fields["contentts"] == TRANS_HEX
+
+def test_lyric_fallback_cdata_only():
+    xml = f'<lyric LyricType="1"><![CDATA[{QRC_HEX}]]></lyric>'
+    assert _extract_lyric_fields(xml) == {"lyric": QRC_HEX}
+
+    # Bare text is only trusted inside <content>/<contentts>
+    assert _extract_lyric_fields(f'<lyric>{QRC_HEX}</lyric>') == {}
+
+@pytest.mark.parametrize("payload", [f"<!--{QRC_HEX}-->", f"<!--<![CDATA[{QRC_HEX}]]>-->"])
+def test_commented_payload(payload):
+    xml = f'<QrcInfos><content>{payload}</content></QrcInfos>'
+
+    assert _extract_lyric_fields(xml) == {"content": QRC_HEX}
+
+def test_blank_first_value_skipped():
+    xml = f'<content>  </content><content><![CDATA[{QRC_HEX}]]></content>'
+
+    assert _extract_lyric_fields(xml) == {"content": QRC_HEX}
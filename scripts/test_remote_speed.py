@@ -4,7 +4,10 @@ TypeF 歌词 API 性能测试脚本
 """
 
 import asyncio
+import sys
 import time
+from collections import defaultdict
+from statistics import fmean
 import httpx
 import json
 
@@ -84,59 +87,79 @@ async def run_tests():
     report_file = os.path.join(output_dir, "report.txt")
     
     lines_out = []
+    flushed = 0
     
     def log(msg):
-        print(msg)
         lines_out.append(msg)
+    
+    def flush():
+        # 按阶段一次性输出到终端，而不是每行一次 print
+        nonlocal flushed
+        sys.stdout.write("\n".join(lines_out[flushed:]) + "\n")
+        sys.stdout.flush()
+        flushed = len(lines_out)
 
     log("=" * 70)
     log("TypeF 歌词 API 性能测试 (Remote)")
     log(f"API 地址: {remote_api}")
     log(f"Output: {output_dir}")
     log("=" * 70)
+    flush()
+    
+    # 所有用例并发发出，总耗时约等于最慢的一次请求；单次耗时仍在 test_api 内各自计时
+    # HTTPS 远程地址上通过 ALPN 协商 HTTP/2，并发请求复用同一条连接；明文 http 仍走 HTTP/1.1
+    limits = httpx.Limits(max_keepalive_connections=5, keepalive_expiry=30.0)
+    async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=5.0), trust_env=False, http2=True, limits=limits) as client:
+        # 预热：先建立 TCP/TLS 连接，计时结果只反映稳定状态下的 API 延迟
+        try:
+            await client.get(f"{remote_api}/v1/health")
+        except httpx.HTTPError as e:
+            log(f"预热请求失败: {e}")
+        
+        wall_start = time.perf_counter()
+        results = await asyncio.gather(*(test_api(remote_api, test, client) for test in TEST_CASES))
+    wall_time = time.perf_counter() - wall_start
     
-    results = []
-    async with httpx.AsyncClient(timeout=60.0, trust_env=False) as client:
-        for test in TEST_CASES:
-            result = await test_api(remote_api, test, client)
-            results.append(result)
-            status_icon = "✅" if result["status"] == "OK" else "❌"
-            log(f"\n{status_icon} {result['song']}")
-            log(f"   ⏱️  时间: {result['time']:.2f}s")
-            log(f"   📁 来源: {result['source']}")
-            log(f"   📝 类型: {result['type']}, {result['lines']} 行")
+    for result in results:
+        status_icon = "✅" if result["status"] == "OK" else "❌"
+        log(f"\n{status_icon} {result['song']}")
+        log(f"   ⏱️  时间: {result['time']:.2f}s")
+        log(f"   📁 来源: {result['source']}")
+        log(f"   📝 类型: {result['type']}, {result['lines']} 行")
+    flush()
     
     log("\n" + "=" * 70)
     log("📊 性能统计")
     log("=" * 70)
     
-    ok_results = [r for r in results if r["status"] == "OK"]
-    if ok_results:
-        times = [r["time"] for r in ok_results]
-        avg = sum(times) / len(times)
+    # 一次遍历同时收集成功耗时与按来源累计的 [总耗时, 数量]
+    times = []
+    sources = defaultdict(lambda: [0.0, 0])
+    for r in results:
+        if r["status"] == "OK":
+            times.append(r["time"])
+            acc = sources[r["source"]]
+            acc[0] += r["time"]
+            acc[1] += 1
+    
+    if times:
+        avg = fmean(times)
         min_t = min(times)
         max_t = max(times)
-        log(f"   成功请求数: {len(ok_results)}/{len(results)}")
+        log(f"   成功请求数: {len(times)}/{len(results)}")
         log(f"   平均响应时间: {avg:.2f}s")
         log(f"   最快响应时间: {min_t:.2f}s")
         log(f"   最慢响应时间: {max_t:.2f}s")
-        
-        # By source breakdown
-        sources = {}
-        for r in ok_results:
-            src = r["source"]
-            if src not in sources:
-                sources[src] = []
-            sources[src].append(r["time"])
+        log(f"   并发总耗时: {wall_time:.2f}s")
         
         log("\n   按数据来源分组:")
-        for src, times in sources.items():
-            avg_src = sum(times) / len(times)
-            log(f"   - {src}: 平均 {avg_src:.2f}s ({len(times)} 首)")
+        for src, (total, count) in sources.items():
+            log(f"   - {src}: 平均 {total / count:.2f}s ({count} 首)")
     else:
         log("   所有请求均失败")
     
     log("=" * 70)
+    flush()
     
     with open(report_file, "w", encoding="utf-8") as f:
         f.write("\n".join(lines_out))